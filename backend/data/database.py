@@ -2,6 +2,7 @@ import platform
 from pathlib import Path
 import logging
 from sqlmodel import SQLModel
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
 import asyncio
 
@@ -9,6 +10,24 @@ import asyncio
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Applied to every new connection: WAL lets readers run while a writer commits
+_SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+]
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class DatabaseManager:
     """Manages database initialization, configuration and deletion."""
@@ -48,6 +67,7 @@ class DatabaseManager:
                 echo=self.echo,
                 connect_args={"check_same_thread": False}
             )
+            event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
 
             # Create tables only if they don't exist
             async with self.engine.begin() as conn:
@@ -72,6 +92,9 @@ class DatabaseManager:
                 logger.info(f"Deleting database: {db_path}")
                 if db_path.exists():
                     db_path.unlink(missing_ok=True)
+                    # WAL sidecars left behind would be replayed into the next database
+                    for suffix in ("-wal", "-shm"):
+                        db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
                     logger.info("Database deleted.")
                     return True
                 else:
@@ -1,6 +1,7 @@
 from typing import Optional, List
 from datetime import datetime, timezone
 from sqlmodel import select
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.application import Application
 
@@ -173,8 +174,6 @@ class ApplicationManager:
         Returns:
             bool: True if all applications were deleted, False otherwise.
         """
-        applications = await self.get_applications()
-        for application in applications:
-            await self.session.delete(application)
+        await self.session.execute(delete(Application))
         await self.session.commit()
         return True
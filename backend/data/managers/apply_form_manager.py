@@ -1,5 +1,6 @@
 from typing import Optional, List
 from sqlmodel import select
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.apply_form import ApplicationForm
 
@@ -80,11 +81,7 @@ class ApplyFormManager:
         Returns:
             bool: True if successful
         """
-        result = await self.session.execute(select(ApplicationForm))
-        apply_forms = result.scalars().all()
-
-        for apply_form in apply_forms:
-            await self.session.delete(apply_form)
+        await self.session.execute(delete(ApplicationForm))
         await self.session.commit()
         return True
 
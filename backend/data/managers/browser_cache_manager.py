@@ -1,3 +1,4 @@
+import os
 import shutil
 from datetime import datetime
 from typing import Optional, Tuple
@@ -15,6 +16,12 @@ from ..database import get_app_data_dir
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chromium rebuilds these on demand; they hold no session state worth archiving
+_SKIPPED_PROFILE_DIRS = {
+    "Cache", "Code Cache", "GPUCache", "GrShaderCache", "ShaderCache",
+    "DawnCache", "GraphiteDawnCache", "Crashpad", "component_crx_cache",
+}
+
 class BrowserCacheManager:
     def __init__(self, session: AsyncSession):
         """Initialize the manager with a database session."""
@@ -43,7 +50,7 @@ class BrowserCacheManager:
 
     def _compress_directory(self, directory_path: Path) -> Optional[bytes]:
         """
-        Compresses a directory in memory.
+        Compresses a directory in memory, leaving out Chromium's rebuildable caches.
         Args:
             directory_path (Path): Directory to compress
         Returns:
@@ -56,10 +63,16 @@ class BrowserCacheManager:
         try:
             zip_buffer = BytesIO()
             with ZipFile(zip_buffer, 'w', compression=ZIP_DEFLATED, compresslevel=9) as zip_file:
-                for file_path in directory_path.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(directory_path)
-                        zip_file.write(file_path, arcname)
+                for root, dirs, files in os.walk(directory_path):
+                    # Pruning in place keeps os.walk from descending into skipped caches
+                    dirs[:] = [d for d in dirs if d not in _SKIPPED_PROFILE_DIRS]
+                    root_path = Path(root)
+                    for name in files:
+                        file_path = root_path / name
+                        # Only regular files: Chromium leaves Singleton* symlinks and sockets behind
+                        if file_path.is_symlink() or not file_path.is_file():
+                            continue
+                        zip_file.write(file_path, file_path.relative_to(directory_path))
             return zip_buffer.getvalue()
         except Exception as e:
             logger.error(f"Error during compression: {e}")
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from sqlmodel import select
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.cover_letter import CoverLetter
 from ..database import get_app_data_dir
@@ -30,12 +31,14 @@ class CoverLetterManager:
         await self.session.commit()
         return cover_letter
 
-    async def add_pdf_to_cover_letter(self, cover_letter_id: int, pdf_data: bytes) -> Optional[CoverLetter]:
+    async def add_pdf_to_cover_letter(self, cover_letter_id: int, pdf_data: bytes,
+                                      commit: bool = True) -> Optional[CoverLetter]:
         """
         Adds a PDF to an existing cover letter.
         Args:
             cover_letter_id (int): ID of the letter.
             pdf_data (bytes): PDF file data.
+            commit (bool): Commit immediately, or leave it to the caller to commit a batch.
         Returns:
             Optional[CoverLetter]: The updated letter or None if not found.
         """
@@ -45,7 +48,8 @@ class CoverLetterManager:
 
         cover_letter.pdf_data = pdf_data
         self.session.add(cover_letter)
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
         return cover_letter
 
     async def get_cover_letters(self) -> List[CoverLetter]:
@@ -112,9 +116,7 @@ class CoverLetterManager:
         Returns:
             bool: True if all letters were deleted, False otherwise.
         """
-        cover_letters = await self.get_cover_letters()
-        for cover_letter in cover_letters:
-            await self.session.delete(cover_letter)
+        await self.session.execute(delete(CoverLetter))
         await self.session.commit()
         return True
 
@@ -43,19 +43,8 @@ class DocumentManager:
             Document: The created document
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File {file_path} does not exist")
-
-        document = Document(
-            user_id=user_id,
-            name=path.name,
-            document_type=document_type,
-            content=path.read_bytes(),
-        )
-
-        self.session.add(document)
-        await self.session.commit()
-        return document
+        # read_bytes raises FileNotFoundError itself, no separate existence check
+        return await self.add_document(user_id, path.name, document_type, path.read_bytes())
 
     async def get_document(self, document_id: int) -> Optional[Document]:
         """
@@ -91,16 +80,25 @@ class DocumentManager:
         Returns:
             Optional[Document]: The updated document or None if not found
         """
+        path = Path(file_path)
+        return await self.update_document(document_id, path.name, path.read_bytes())
+
+    async def update_document(self, document_id: int, name: str, content: bytes) -> Optional[Document]:
+        """
+        Updates an existing document with content already in memory.
+        Args:
+            document_id (int): Document ID
+            name (str): New document name
+            content (bytes): New document content
+        Returns:
+            Optional[Document]: The updated document or None if not found
+        """
         document = await self.get_document(document_id)
         if not document:
             return None
 
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File {file_path} does not exist")
-
-        document.name = path.name
-        document.content = path.read_bytes()
+        document.name = name
+        document.content = content
         self.session.add(document)
         await self.session.commit()
         return document
@@ -1,17 +1,24 @@
-from typing import Optional, List
-from sqlmodel import select
+from typing import Optional, List, Set, Tuple, AsyncIterator
+from sqlmodel import select, func
+from sqlalchemy import exists
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.job_offer import JobOffer
+from ..models.application import Application
 import logging
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Columns a scraped offer must have to be stored
+_REQUIRED_FIELDS = ("external_id", "job_description", "job_link")
+
 class JobOfferManager:
     def __init__(self, session: AsyncSession):
         self.session = session
-        # Adding a lock to avoid concurrent operations using the same session
-        self._db_lock = asyncio.Lock()
+        # Adding a lock to avoid concurrent operations using the same session,
+        # shared by every manager built on that session
+        self._db_lock = session.info.setdefault("job_offer_lock", asyncio.Lock())
 
     async def add_job_offer(self, **kwargs) -> Optional[JobOffer]:
         """
@@ -41,6 +48,40 @@ class JobOfferManager:
             await self.session.commit()
             return job_offer
 
+    @staticmethod
+    def has_required_fields(row: dict) -> bool:
+        """
+        Checks that a job offer row has every field required to be stored.
+        Args:
+            row (dict): Job offer data.
+        Returns:
+            bool: True if add_job_offers_bulk would keep the row.
+        """
+        return all(row.get(field) for field in _REQUIRED_FIELDS)
+
+    async def add_job_offers_bulk(self, rows: List[dict]) -> int:
+        """
+        Adds several job offers in a single transaction.
+        Offers whose `external_id` already exists are skipped.
+        Args:
+            rows (List[dict]): Job offer data, one dict per offer.
+        Returns:
+            int: Number of offers inserted.
+        """
+        valid_rows = [row for row in rows if self.has_required_fields(row)]
+        if len(valid_rows) < len(rows):
+            logger.warning(f"Skipped {len(rows) - len(valid_rows)} job offers with missing required fields")
+        if not valid_rows:
+            return 0
+
+        async with self._db_lock:
+            result = await self.session.execute(
+                insert(JobOffer.__table__).on_conflict_do_nothing(index_elements=["external_id"]),
+                valid_rows
+            )
+            await self.session.commit()
+            return result.rowcount
+
     async def get_job_offers(self) -> List[JobOffer]:
         """
         Retrieves all job offers.
@@ -50,6 +91,26 @@ class JobOfferManager:
         result = await self.session.execute(select(JobOffer))
         return result.scalars().all()
 
+    async def iter_job_offer_summaries(self, batch_size: int = 500) -> AsyncIterator[List[Tuple[int, str, str, str, bool]]]:
+        """
+        Streams the columns needed to list job offers, batch by batch, instead of loading
+        every offer with its description at once. The session lock is held until the
+        iteration ends, so consume the batches without awaiting other database work.
+        Args:
+            batch_size (int): Number of rows fetched from the cursor per batch.
+        Returns:
+            AsyncIterator[List[Tuple[int, str, str, str, bool]]]: Batches of
+            (id, job_title, company_name, work_location, quick_apply) rows ordered by ID.
+        """
+        stmt = select(
+            JobOffer.id, JobOffer.job_title, JobOffer.company_name,
+            JobOffer.work_location, JobOffer.quick_apply
+        ).order_by(JobOffer.id).execution_options(yield_per=batch_size)
+        async with self._db_lock:
+            result = await self.session.stream(stmt)
+            async for partition in result.partitions():
+                yield [tuple(row) for row in partition]
+
     async def get_job_offers_by_quick_apply(self) -> List[JobOffer]:
         """
         Retrieves job offers with quick apply enabled.
@@ -61,6 +122,52 @@ class JobOfferManager:
         )
         return result.scalars().all()
 
+    async def get_pending_quick_apply_offers(self, user_id: int, limit: Optional[int] = None) -> List[JobOffer]:
+        """
+        Retrieves the quick apply job offers the user has not applied to yet, in one query.
+        Args:
+            user_id (int): ID of the user.
+            limit (Optional[int]): Maximum number of offers, all of them if None.
+        Returns:
+            List[JobOffer]: List of pending Quick Apply job offers.
+        """
+        query = select(JobOffer).where(JobOffer.quick_apply == True, ~self._applied_by(user_id))
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def count_job_offers(self, quick_apply_only: bool = False) -> int:
+        """
+        Counts the job offers without loading them.
+        Args:
+            quick_apply_only (bool): Only count offers with quick apply enabled.
+        Returns:
+            int: Number of job offers.
+        """
+        query = select(func.count()).select_from(JobOffer)
+        if quick_apply_only:
+            query = query.where(JobOffer.quick_apply == True)
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    async def count_pending_quick_apply_offers(self, user_id: int) -> int:
+        """
+        Counts the quick apply job offers the user has not applied to yet.
+        Args:
+            user_id (int): ID of the user.
+        Returns:
+            int: Number of pending Quick Apply job offers.
+        """
+        query = select(func.count()).select_from(JobOffer).where(
+            JobOffer.quick_apply == True, ~self._applied_by(user_id)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    def _applied_by(self, user_id: int):
+        return exists().where(Application.job_id == JobOffer.id, Application.user_id == user_id)
+
     async def get_job_offer_by_id(self, id: int) -> Optional[JobOffer]:
         """
         Retrieves a job offer by its ID.
@@ -159,6 +266,16 @@ class JobOfferManager:
             job_offer = await self._get_job_offer_by_external_id_no_lock(external_id)
             return job_offer is not None
 
+    async def get_external_ids(self) -> Set[str]:
+        """
+        Retrieves the external_id of every stored job offer.
+        Returns:
+            Set[str]: External identifiers of the offers.
+        """
+        async with self._db_lock:
+            result = await self.session.execute(select(JobOffer.external_id))
+            return set(result.scalars().all())
+
     async def _get_job_offer_by_external_id_no_lock(self, external_id: str) -> Optional[JobOffer]:
         result = await self.session.execute(
             select(JobOffer).where(JobOffer.external_id == external_id)
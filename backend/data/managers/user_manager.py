@@ -1,5 +1,5 @@
-from typing import Optional, List
-from sqlmodel import select
+from typing import Optional, List, Tuple
+from sqlmodel import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.user import User
 
@@ -37,6 +37,26 @@ class UserManager:
         result = await self.session.execute(select(User))
         return result.scalars().all()
 
+    async def get_user_summaries(self) -> List[Tuple[int, str, str, str]]:
+        """
+        Retrieves the columns needed to list users, without loading CVs or signatures.
+        Returns:
+            List[Tuple[int, str, str, str]]: (id, first_name, last_name, email) rows ordered by ID.
+        """
+        result = await self.session.execute(
+            select(User.id, User.first_name, User.last_name, User.email).order_by(User.id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def count_users(self) -> int:
+        """
+        Counts the users without loading them.
+        Returns:
+            int: Number of users.
+        """
+        result = await self.session.execute(select(func.count()).select_from(User))
+        return result.scalar_one()
+
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         """
         Retrieves a user by their ID.
@@ -48,6 +68,17 @@ class UserManager:
         return await self.session.get(User, user_id)
 
 
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        """
+        Retrieves a user by their email.
+        Args:
+            email (str): User email.
+        Returns:
+            Optional[User]: The found user or None.
+        """
+        result = await self.session.execute(select(User).where(User.email == email))
+        return result.scalar_one_or_none()
+
     async def update_user(self, user_id: int, **kwargs) -> Optional[User]:
         """
         Updates user information.
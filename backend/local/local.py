@@ -1,13 +1,10 @@
 import sys
 import logging
 import asyncio
+import importlib
 from typing import Optional
 from data.database import DatabaseManager
-from .menus.database_menu import DatabaseMenu
-from .menus.user_menu import UserMenu
-from .menus.jobup_menu import JobUpMenu
-from .menus.document_menu import DocumentMenu
-from .menus.keyword_menu import KeywordMenu
+from .menus.base_menu import BaseMenu
 
 # Logging configuration
 logging.basicConfig(
@@ -21,11 +18,21 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Menu modules pull in Playwright, the generators and rich, import them only when opened
+_MENU_MODULES = {
+    '1': ('.menus.database_menu', 'DatabaseMenu'),
+    '2': ('.menus.user_menu', 'UserMenu'),
+    '3': ('.menus.jobup_menu', 'JobUpMenu'),
+    '4': ('.menus.document_menu', 'DocumentMenu'),
+    '5': ('.menus.keyword_menu', 'KeywordMenu')
+}
+
 class LocalApp:
     def __init__(self):
         """Initialize the local application with database connection and menus."""
         self.db: Optional[DatabaseManager] = None
         self.session = None
+        self.menu_classes = {}
         self.menus = {}
 
     async def initialize(self):
@@ -50,36 +57,41 @@ class LocalApp:
             raise
 
     def init_menus(self):
-        """Initialize all menu classes."""
-        try:
-            self.menus = {
-                '1': DatabaseMenu(self.session),
-                '2': UserMenu(self.session),
-                '3': JobUpMenu(self.session),
-                '4': DocumentMenu(self.session),
-                '5': KeywordMenu(self.session)
-            }
-            logger.info("All menus initialized")
-        except Exception as e:
-            logger.error(f"Menu initialization failed: {e}")
-            raise
+        """Register menu classes, each menu is built the first time it is opened."""
+        self.menu_classes = dict(_MENU_MODULES)
+        self.menus = {}
+        logger.info("All menus registered")
+
+    def get_menu(self, choice: str) -> BaseMenu:
+        """Return the menu for a main menu choice, importing, building and caching it on first use."""
+        menu = self.menus.get(choice)
+        if menu is None:
+            try:
+                module_name, class_name = self.menu_classes[choice]
+                module = importlib.import_module(module_name, __package__)
+                menu = getattr(module, class_name)(self.session)
+            except Exception as e:
+                logger.error(f"Menu initialization failed: {e}")
+                raise
+            self.menus[choice] = menu
+        return menu
 
     async def display_main_menu(self):
         """Display the main menu and handle user input."""
         while True:
             try:
-                self.menus['1'].clear_screen()  # Using any menu's clear_screen method
+                BaseMenu.clear_screen()
                 self._print_main_menu()
-                choice = input("\nEnter your choice (1-6): ").strip()
+                choice = (await asyncio.to_thread(input, "\nEnter your choice (1-6): ")).strip()
 
                 if choice == '6':
                     print("\nGoodbye!")
                     break
-                elif choice in self.menus:
-                    await self.menus[choice].display()
+                elif choice in self.menu_classes:
+                    await self.get_menu(choice).display()
                 else:
                     print("\nInvalid choice! Please try again.")
-                    input("\nPress Enter to continue...")
+                    await asyncio.to_thread(input, "\nPress Enter to continue...")
 
             except KeyboardInterrupt:
                 print("\n\nProgram interrupted by user")
@@ -87,7 +99,7 @@ class LocalApp:
             except Exception as e:
                 logger.error(f"Error in main menu: {e}")
                 print(f"\nAn error occurred: {e}")
-                input("\nPress Enter to continue...")
+                await asyncio.to_thread(input, "\nPress Enter to continue...")
 
     def _print_main_menu(self):
         """Print the main menu options."""
@@ -107,6 +119,10 @@ class LocalApp:
         if self.db:
             await self.db.close()
             self.db = None
+        # Only loaded once a menu generated a PDF, importing it here would defeat the lazy menus
+        pdf_builder = sys.modules.get("services.generation.pdf_builder")
+        if pdf_builder is not None:
+            pdf_builder.shutdown_pdf_executor()
 
     async def run(self):
         """Main entry point to run the application."""
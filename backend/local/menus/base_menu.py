@@ -7,7 +7,8 @@ class BaseMenu(ABC):
     def __init__(self, session: Session):
         self.session = session
 
-    def clear_screen(self):
+    @staticmethod
+    def clear_screen():
         """Clear the terminal screen."""
         os.system('cls' if os.name == 'nt' else 'clear')
 
@@ -16,6 +17,10 @@ class BaseMenu(ABC):
         self.clear_screen()
         print(f"\n=== {title} ===\n")
 
+    async def read_input(self, prompt: str = "") -> str:
+        """Read a line without blocking the event loop (background scraping keeps running)."""
+        return await asyncio.to_thread(input, prompt)
+
     async def wait_for_user(self, prompt: str = "Press Enter to continue..."):
         # Use asyncio.to_thread to run the blocking input() in a separate thread
         return await asyncio.to_thread(input, prompt)
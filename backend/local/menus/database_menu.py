@@ -17,7 +17,7 @@ class DatabaseMenu(BaseMenu):
             print("2. Reset Database")
             print("3. Back to Main Menu")
 
-            choice = input("\nEnter your choice (1-3): ")
+            choice = await self.read_input("\nEnter your choice (1-3): ")
 
             if choice == '1':
                 await self.show_info()
@@ -31,14 +31,14 @@ class DatabaseMenu(BaseMenu):
 
     async def show_info(self):
         print("\nDatabase Information:")
-        users = len(await self.user_manager.get_users())
-        jobs = len(await self.job_manager.get_job_offers())
+        users = await self.user_manager.count_users()
+        jobs = await self.job_manager.count_job_offers()
         print(f"Users: {users}")
         print(f"Job Offers: {jobs}")
         await self.wait_for_user()
 
     async def reset_database(self):
-        confirm = input("\nWARNING: This will delete all data. Are you sure? (yes/no): ")
+        confirm = await self.read_input("\nWARNING: This will delete all data. Are you sure? (yes/no): ")
         if confirm.lower() == 'yes':
             if await self.db.delete_database():
                 print("Database reset successful")
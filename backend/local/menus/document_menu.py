@@ -1,3 +1,4 @@
+import asyncio
 from .base_menu import BaseMenu
 from data.managers.document_manager import DocumentManager
 from data.managers.cover_letter_manager import CoverLetterManager
@@ -17,7 +18,7 @@ class DocumentMenu(BaseMenu):
             print("3. Delete Document")
             print("4. Back to Main Menu")
 
-            choice = input("\nEnter your choice (1-4): ")
+            choice = await self.read_input("\nEnter your choice (1-4): ")
 
             if choice == '1':
                 await self.list_documents()
@@ -33,7 +34,7 @@ class DocumentMenu(BaseMenu):
 
     async def list_documents(self):
         try:
-            user_id = int(input("\nEnter user ID: "))
+            user_id = int(await self.read_input("\nEnter user ID: "))
             documents = await self.document_manager.get_user_documents(user_id)
             print("\nUser Documents:")
             for doc in documents:
@@ -44,13 +45,13 @@ class DocumentMenu(BaseMenu):
 
     async def add_document(self):
         try:
-            user_id = int(input("\nEnter user ID: "))
+            user_id = int(await self.read_input("\nEnter user ID: "))
 
             # Ask for document type first
             print("\nSelect document type:")
             print("1. CV")
             print("2. Others")
-            type_choice = input("Enter your choice (1-2): ")
+            type_choice = await self.read_input("Enter your choice (1-2): ")
 
             if type_choice == "1":
                 doc_type = "CV"
@@ -67,11 +68,13 @@ class DocumentMenu(BaseMenu):
             )
 
             try:
-                file_path = GetOpenFileNameW(
+                # The native dialog is modal, keep it off the event loop
+                file_path = (await asyncio.to_thread(
+                    GetOpenFileNameW,
                     Filter=file_filter,
                     Title="Select document",
                     InitialDir="C:\\"
-                )[0]  # [0] returns only the file path
+                ))[0]  # [0] returns only the file path
 
                 if file_path:  # If a file was selected
                     doc = await self.document_manager.add_document_from_path(user_id, file_path, doc_type)
@@ -89,7 +92,7 @@ class DocumentMenu(BaseMenu):
 
     async def delete_document(self):
         try:
-            doc_id = int(input("\nEnter document ID to delete: "))
+            doc_id = int(await self.read_input("\nEnter document ID to delete: "))
             if await self.document_manager.delete_document(doc_id):
                 print("Document deleted successfully")
             else:
@@ -30,7 +30,7 @@ class JobUpMenu(BaseMenu):
             print("8. Reset postulation data")
             print("9. Back to Main Menu")
 
-            choice = input("\nEnter your choice (1-5): ")
+            choice = await self.read_input("\nEnter your choice (1-5): ")
 
             if choice == '1':
                 await self.scraping_menu.display()
@@ -56,7 +56,7 @@ class JobUpMenu(BaseMenu):
 
     async def login_jobup(self):
         try:
-            user_id = int(input("\nEnter user ID for login: "))
+            user_id = int(await self.read_input("\nEnter user ID for login: "))
             print(f"\nLaunching browser for user {user_id}...")
             message = await launch_browser_and_save_session(user_id, self.session)
             print(f"Login result: {message}")
@@ -82,8 +82,8 @@ class JobUpMenu(BaseMenu):
 
     async def apply_to_job(self):
         try:
-            user_id = int(input("\nEnter user ID: "))
-            apply_number = int(input("Enter the number of applications to process: "))
+            user_id = int(await self.read_input("\nEnter user ID: "))
+            apply_number = int(await self.read_input("Enter the number of applications to process: "))
             auto_apply = AutoApply(self.session, user_id)
             await auto_apply.process_job_offers(apply_number)
         except ValueError:
@@ -93,16 +93,16 @@ class JobUpMenu(BaseMenu):
         await self.wait_for_user()
 
     async def create_apply_form(self):
-        user_id = int(input("\nEnter user ID: "))
+        user_id = int(await self.read_input("\nEnter user ID: "))
         form_filler = FormFiller(self.session, user_id)
 
-        firstname = input("Enter your first name: ")
-        lastname = input("Enter your last name: ")
-        email = input("Enter your email: ")
-        phone = input("Enter your phone number: ")
-        zipcode = input("Enter your zipcode: ")
-        gender = input("Enter your gender: ")
-        availability = input("Enter your availability (months, max 6): ")
+        firstname = await self.read_input("Enter your first name: ")
+        lastname = await self.read_input("Enter your last name: ")
+        email = await self.read_input("Enter your email: ")
+        phone = await self.read_input("Enter your phone number: ")
+        zipcode = await self.read_input("Enter your zipcode: ")
+        gender = await self.read_input("Enter your gender: ")
+        availability = await self.read_input("Enter your availability (months, max 6): ")
         print("""
                 Available Work Permits:
                 --------------------
@@ -117,7 +117,7 @@ class JobUpMenu(BaseMenu):
                 9 - Protection Status - S Permit
                 10 - No Authorization
     """)
-        work_permit = input("Enter your work permit index: ")
+        work_permit = await self.read_input("Enter your work permit index: ")
         auto_answer_requirements = "true"
         if await form_filler.create_form_data(
             firstname=firstname,
@@ -136,13 +136,16 @@ class JobUpMenu(BaseMenu):
         await self.wait_for_user()
 
     async def list_jobs(self):
-        jobs = await self.job_manager.get_job_offers()
         print("\nJob Offers:")
-        for job in jobs:
-            print(f"\nID: {job.id}")
-            print(f"Title: {job.job_title}")
-            print(f"Company: {job.company_name}")
-            print(f"Location: {job.work_location}")
-            print(f"Quick Apply: {'Yes' if job.quick_apply else 'No'}")
-            print("-" * 50)
+        # Print each streamed batch in one write, the first offers show up before the rest is read
+        async for batch in self.job_manager.iter_job_offer_summaries():
+            print("".join(
+                f"\nID: {job_id}\n"
+                f"Title: {job_title}\n"
+                f"Company: {company_name}\n"
+                f"Location: {work_location}\n"
+                f"Quick Apply: {'Yes' if quick_apply else 'No'}\n"
+                f"{'-' * 50}\n"
+                for job_id, job_title, company_name, work_location, quick_apply in batch
+            ), end="")
         await self.wait_for_user()
\ No newline at end of file
@@ -45,7 +45,7 @@ class KeywordMenu(BaseMenu):
             print("6. Manage Keywords")
             print("7. Back to Main Menu")
 
-            choice = input("\nEnter your choice (1-7): ")
+            choice = await self.read_input("\nEnter your choice (1-7): ")
 
             if choice == "1":
                 await self.generate_keywords()
@@ -62,7 +62,7 @@ class KeywordMenu(BaseMenu):
             elif choice == "7":
                 if self._scheduler and self._scheduler.running:
                     console.print("[yellow]Warning: Automatic scraping is still running[/yellow]")
-                    if input("Do you want to stop it before exiting? (y/n): ").lower() == 'y':
+                    if (await self.read_input("Do you want to stop it before exiting? (y/n): ")).lower() == 'y':
                         await self.stop_automatic_scraping()
                 break
             else:
@@ -76,7 +76,7 @@ class KeywordMenu(BaseMenu):
         # Load existing configuration if available
         config_path = os.path.join(os.getcwd(), "scraping_config.json")
         if os.path.exists(config_path):
-            if input("Found existing configuration. Do you want to load it? (y/n): ").lower() == 'y':
+            if (await self.read_input("Found existing configuration. Do you want to load it? (y/n): ")).lower() == 'y':
                 if self.scraping_config.import_config(config_path):
                     console.print("[green]Configuration loaded successfully[/green]")
                 else:
@@ -93,7 +93,7 @@ class KeywordMenu(BaseMenu):
             print("7. Import Configuration")
             print("8. Back")
 
-            subchoice = input("\nEnter your choice (1-8): ")
+            subchoice = await self.read_input("\nEnter your choice (1-8): ")
 
             if subchoice == "1":
                 await self.set_employment_grade()
@@ -120,8 +120,8 @@ class KeywordMenu(BaseMenu):
         self.print_header("Set Employment Grade")
         try:
             print("Enter employment grade range (0-100)")
-            min_grade = input("Minimum grade (press Enter to skip): ")
-            max_grade = input("Maximum grade (press Enter to skip): ")
+            min_grade = await self.read_input("Minimum grade (press Enter to skip): ")
+            max_grade = await self.read_input("Maximum grade (press Enter to skip): ")
 
             self.scraping_config.employment_grade_min = int(min_grade) if min_grade else None
             self.scraping_config.employment_grade_max = int(max_grade) if max_grade else None
@@ -140,7 +140,7 @@ class KeywordMenu(BaseMenu):
             print(f"{date_id}. {date_name}")
 
         try:
-            date_choice = input("\nSelect date range (press Enter to skip): ")
+            date_choice = await self.read_input("\nSelect date range (press Enter to skip): ")
             self.scraping_config.publication_date = int(date_choice) if date_choice else None
             if self.scraping_config.publication_date:
                 print(f"Publication date set to: {dates.get(self.scraping_config.publication_date)}")
@@ -162,7 +162,7 @@ class KeywordMenu(BaseMenu):
                     print(f"    {sub_id}. {sub_name}")
 
         try:
-            cat_input = input("\nEnter category IDs (comma-separated, Enter to skip): ")
+            cat_input = await self.read_input("\nEnter category IDs (comma-separated, Enter to skip): ")
             if cat_input:
                 self.scraping_config.category = [int(x.strip()) for x in cat_input.split(",")]
         except ValueError:
@@ -182,7 +182,7 @@ class KeywordMenu(BaseMenu):
                     print(f"    {sub_id}. {sub_name}")
 
         try:
-            reg_input = input("\nEnter region IDs (comma-separated, Enter to skip): ")
+            reg_input = await self.read_input("\nEnter region IDs (comma-separated, Enter to skip): ")
             if reg_input:
                 self.scraping_config.region = [int(x.strip()) for x in reg_input.split(",")]
         except ValueError:
@@ -232,7 +232,7 @@ class KeywordMenu(BaseMenu):
         self.print_header("Export Configuration")
 
         default_path = os.path.join(os.getcwd(), "scraping_config.json")
-        filepath = input(f"Enter export path (default: {default_path}): ").strip() or default_path
+        filepath = (await self.read_input(f"Enter export path (default: {default_path}): ")).strip() or default_path
 
         if self.scraping_config.export_config(filepath):
             console.print(f"[green]Configuration exported to: {filepath}[/green]")
@@ -245,7 +245,7 @@ class KeywordMenu(BaseMenu):
         """Import a configuration file"""
         self.print_header("Import Configuration")
 
-        filepath = input("Enter configuration file path: ").strip()
+        filepath = (await self.read_input("Enter configuration file path: ")).strip()
         if not filepath:
             console.print("[red]No file path provided[/red]")
             await self.wait_for_user()
@@ -287,7 +287,7 @@ class KeywordMenu(BaseMenu):
         console.print("This tool will analyze your CV and preferences to generate relevant job search keywords.")
 
         try:
-            user_id = int(console.input("[cyan]Enter your user ID: [/cyan]"))
+            user_id = int(await asyncio.to_thread(console.input, "[cyan]Enter your user ID: [/cyan]"))
         except ValueError:
             console.print("[red]Invalid user ID. Please enter a number.[/red]")
             await self.wait_for_user()
@@ -299,7 +299,7 @@ class KeywordMenu(BaseMenu):
         print("2. French (fr)")
         print("3. German (de)")
 
-        lang_choice = input("\nEnter your choice (1-3): ").strip()
+        lang_choice = (await self.read_input("\nEnter your choice (1-3): ")).strip()
         language = None
         if lang_choice == "1":
             language = "english"
@@ -417,7 +417,7 @@ class KeywordMenu(BaseMenu):
         self.print_header("Quick Apply Jobs Status")
 
         try:
-            user_id = int(console.input("[cyan]Enter your user ID: [/cyan]"))
+            user_id = int(await asyncio.to_thread(console.input, "[cyan]Enter your user ID: [/cyan]"))
         except ValueError:
             console.print("[red]Invalid user ID. Please enter a number.[/red]")
             await self.wait_for_user()
@@ -457,14 +457,14 @@ class KeywordMenu(BaseMenu):
             print("3. Clear All Keywords")
             print("4. Back")
 
-            choice = input("\nEnter your choice (1-4): ")
+            choice = await self.read_input("\nEnter your choice (1-4): ")
 
             if choice == "1":
                 await self.add_keywords_manually()
             elif choice == "2":
                 await self.remove_keywords()
             elif choice == "3":
-                if input("Are you sure you want to clear all keywords? (y/n): ").lower() == 'y':
+                if (await self.read_input("Are you sure you want to clear all keywords? (y/n): ")).lower() == 'y':
                     self._current_keywords = []
                     self.scraping_config.keywords = []
                     console.print("[green]All keywords cleared[/green]")
@@ -495,7 +495,7 @@ class KeywordMenu(BaseMenu):
         print("Enter keywords (one per line, empty line to finish):")
 
         while True:
-            keyword = input().strip()
+            keyword = (await self.read_input()).strip()
             if not keyword:
                 break
             if keyword not in self._current_keywords:
@@ -515,7 +515,7 @@ class KeywordMenu(BaseMenu):
         self.display_keywords_numbered()
         print("\nEnter the numbers of keywords to remove (comma-separated):")
         try:
-            numbers = input().strip()
+            numbers = (await self.read_input()).strip()
             if not numbers:
                 return
 
@@ -28,7 +28,7 @@ class ScrapingMenu(BaseMenu):
             print("10. Start Scraping")
             print("11. Back to Main Menu")
 
-            choice = input("\nEnter your choice (1-11): ")
+            choice = await self.read_input("\nEnter your choice (1-11): ")
 
             if choice == '1':
                 await self.set_search_term()
@@ -62,7 +62,7 @@ class ScrapingMenu(BaseMenu):
         
         # Get the export path
         default_path = os.path.join(os.getcwd(), "scraping_config.json")
-        filepath = input(f"Enter export path (default: {default_path}): ").strip()
+        filepath = (await self.read_input(f"Enter export path (default: {default_path}): ")).strip()
         if not filepath:
             filepath = default_path
 
@@ -79,7 +79,7 @@ class ScrapingMenu(BaseMenu):
         self.print_header("Import Configuration")
         
         # Get the import path
-        filepath = input("Enter the path to the configuration file: ").strip()
+        filepath = (await self.read_input("Enter the path to the configuration file: ")).strip()
         if not filepath:
             console.print("[red]No file path provided[/red]")
             await self.wait_for_user()
@@ -95,7 +95,7 @@ class ScrapingMenu(BaseMenu):
 
     async def set_search_term(self):
         self.print_header("Set Search Term")
-        term = input("Enter search term (press Enter to skip): ")
+        term = await self.read_input("Enter search term (press Enter to skip): ")
         self.config.term = term if term else None
         print(f"Search term set to: {self.config.term}")
         await self.wait_for_user()
@@ -104,8 +104,8 @@ class ScrapingMenu(BaseMenu):
         self.print_header("Set Employment Grade")
         try:
             print("Enter employment grade range (0-100)")
-            min_grade = input("Minimum grade (press Enter to skip): ")
-            max_grade = input("Maximum grade (press Enter to skip): ")
+            min_grade = await self.read_input("Minimum grade (press Enter to skip): ")
+            max_grade = await self.read_input("Maximum grade (press Enter to skip): ")
 
             self.config.employment_grade_min = int(min_grade) if min_grade else None
             self.config.employment_grade_max = int(max_grade) if max_grade else None
@@ -123,7 +123,7 @@ class ScrapingMenu(BaseMenu):
             print(f"{date_id}. {date_name}")
 
         try:
-            date_choice = input("\nSelect date range (press Enter to skip): ")
+            date_choice = await self.read_input("\nSelect date range (press Enter to skip): ")
             self.config.publication_date = int(date_choice) if date_choice else None
             if self.config.publication_date:
                 print(f"Publication date set to: {dates.get(self.config.publication_date)}")
@@ -145,7 +145,7 @@ class ScrapingMenu(BaseMenu):
 
         print("\nVous pouvez sélectionner des catégories principales ou des sous-catégories.")
         try:
-            cat_input = input("\nEntrez les IDs (séparés par des virgules, Enter pour passer): ")
+            cat_input = await self.read_input("\nEntrez les IDs (séparés par des virgules, Enter pour passer): ")
             if cat_input:
                 cat_list = [int(x.strip()) for x in cat_input.split(",")]
                 valid_cats = []
@@ -193,7 +193,7 @@ class ScrapingMenu(BaseMenu):
         print("- Pour sélectionner des sous-régions spécifiques, entrez leurs IDs")
 
         try:
-            reg_input = input("\nEntrez les IDs des régions (séparés par des virgules, Enter pour passer): ")
+            reg_input = await self.read_input("\nEntrez les IDs des régions (séparés par des virgules, Enter pour passer): ")
             if reg_input:
                 selected_regions = set()  # Utiliser un set pour éviter les doublons
                 input_ids = [int(x.strip()) for x in reg_input.split(",")]
@@ -288,7 +288,7 @@ class ScrapingMenu(BaseMenu):
     async def set_browsers(self):
         self.print_header("Set Number of Browsers")
         try:
-            browsers = input("Enter number of browsers (1-20, default is 5): ")
+            browsers = await self.read_input("Enter number of browsers (1-20, default is 5): ")
             if browsers:
                 num_browsers = int(browsers)
                 if 1 <= num_browsers <= 20:
@@ -302,7 +302,7 @@ class ScrapingMenu(BaseMenu):
 
     async def start_scraping(self):
         self.print_header("Start Scraping")
-        confirm = input("Do you want to start scraping with the current configuration? (yes/no): ")
+        confirm = await self.read_input("Do you want to start scraping with the current configuration? (yes/no): ")
         if confirm.lower() == 'yes':
             print("\nStarting scraper...")
             async with JobScraper(self.session, max_browsers=self.config.max_browsers) as scraper:
@@ -1,11 +1,20 @@
+import asyncio
+import re
+from typing import Dict, Optional, Set, Tuple
 from .base_menu import BaseMenu
 from data.managers.user_manager import UserManager
 from win32gui import GetOpenFileNameW
 
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+", re.ASCII)
+
 class UserMenu(BaseMenu):
     def __init__(self, session):
         super().__init__(session)
         self.user_manager = UserManager(session)
+        # (id, first_name, last_name, email) rows indexed by ID, loaded on first listing and kept in sync locally
+        self._users: Optional[Dict[int, Tuple[int, str, str, str]]] = None
+        # Emails of the cached users, for O(1) duplicate checks
+        self._emails: Set[str] = set()
 
     async def display(self):
         while True:
@@ -17,8 +26,9 @@ class UserMenu(BaseMenu):
             print("5. Manage Reference Letter")
             print("6. Manage User Preferences")
             print("7. Back to Main Menu")
+            print("8. Refresh User List")
 
-            choice = input("\nEnter your choice (1-7): ")
+            choice = await self.read_input("\nEnter your choice (1-8): ")
 
             if choice == '1':
                 await self.list_users()
@@ -34,29 +44,55 @@ class UserMenu(BaseMenu):
                 await self.manage_preferences()
             elif choice == '7':
                 break
+            elif choice == '8':
+                await self.refresh_users()
             else:
                 print("\nInvalid choice!")
                 await self.wait_for_user()
 
+    async def _load_users(self) -> Dict[int, Tuple[int, str, str, str]]:
+        """Load the user rows on first use, later calls return the cache."""
+        if self._users is None:
+            self._users = {row[0]: row for row in await self.user_manager.get_user_summaries()}
+            self._emails = {row[3] for row in self._users.values()}
+        return self._users
+
     async def list_users(self):
-        users = await self.user_manager.get_users()
-        print("\nRegistered Users:")
-        for user in users:
-            print(f"ID: {user.id}, Name: {user.first_name} {user.last_name}, Email: {user.email}")
+        await self._load_users()
+        # One write for the whole listing instead of a line-buffered flush per user
+        lines = ["\nRegistered Users:"]
+        lines.extend(
+            f"ID: {user_id}, Name: {first_name} {last_name}, Email: {email}"
+            for user_id, first_name, last_name, email in self._users.values()
+        )
+        print("\n".join(lines))
         await self.wait_for_user()
 
+    async def refresh_users(self):
+        """Drop the cached rows and list users again from the database."""
+        self._users = None
+        await self.list_users()
+
+    def _cache_user(self, user) -> None:
+        """Record a user found in the database that the cached listing does not know yet."""
+        if self._users is not None and user.id not in self._users:
+            self._users[user.id] = (user.id, user.first_name, user.last_name, user.email)
+            self._emails.add(user.email)
+
     async def add_user_signature(self):
         try:
-            user_id = int(input("\nEnter user ID: "))
+            user_id = int(await self.read_input("\nEnter user ID: "))
 
             # Correctly formatted file filter
             file_filter = "Image Files (*.png;*.jpg;*.jpeg;*.bmp)|*.png;*.jpg;*.jpeg;*.bmp|All Files (*.*)|*.*"
             try:
-                file_path = GetOpenFileNameW(
+                # The native dialog is modal, keep it off the event loop
+                file_path = (await asyncio.to_thread(
+                    GetOpenFileNameW,
                     Filter=file_filter,
                     Title="Select signature image",
                     InitialDir="C:\\"
-                )[0]
+                ))[0]
 
                 if file_path:
                     await self.user_manager.add_signature_from_path(user_id, file_path)
@@ -73,11 +109,11 @@ class UserMenu(BaseMenu):
 
     async def menage_reference_letter(self):
         try:
-            user_id = int(input("\nEnter user ID: "))
+            user_id = int(await self.read_input("\nEnter user ID: "))
             print("\n Choose an option: \n 1. Add Reference Letter \n 2. Delete Reference Letter")
-            choice = input("\nEnter your choice (1-2): ")
+            choice = await self.read_input("\nEnter your choice (1-2): ")
             if choice == '1':
-                reference_text = self.get_multiline_input("Enter reference letter text : ")
+                reference_text = await self.get_multiline_input("Enter reference letter text : ")
                 try:
                     await self.user_manager.add_reference_letter(user_id, reference_text)
                     print(f"\nReference letter added successfully for user ID: {user_id}")
@@ -94,11 +130,16 @@ class UserMenu(BaseMenu):
             print("Invalid user or job ID")
         await self.wait_for_user()
 
-    def get_multiline_input(self, prompt: str) -> str:
+    async def get_multiline_input(self, prompt: str) -> str:
         """
         Allows multiline text input. User ends input with a line containing only '.'
         """
         print(f"{prompt} (end with a line containing only '.')")
+        return await asyncio.to_thread(self._read_lines)
+
+    @staticmethod
+    def _read_lines() -> str:
+        """Blocking part of get_multiline_input, run in a worker thread."""
         lines = []
         while True:
             line = input()
@@ -111,28 +152,67 @@ class UserMenu(BaseMenu):
         print("\nAdding new user:")
         # Simple fields
         user_data = {
-            'first_name': input("First name: "),
-            'last_name': input("Last name: "),
-            'email': input("Email: "),
-            'password': input("Password: "),
-            'username': input("Username: "),
+            'first_name': await self.read_input("First name: "),
+            'last_name': await self.read_input("Last name: "),
+            'email': await self.read_input("Email: "),
         }
+        # Email is unique in the database, report a taken one right away rather than on commit.
+        # The cache may be stale (reset or edits from another menu), so a hit is confirmed in the database
+        await self._load_users()
+        if user_data['email'] in self._emails and not await self.user_manager.get_user_by_email(user_data['email']):
+            self._emails.discard(user_data['email'])
+        if user_data['email'] in self._emails:
+            print(f"\nError adding user: A user with email {user_data['email']} already exists.")
+            await self.wait_for_user()
+            return
+
+        user_data.update({
+            'password': await self.read_input("Password: "),
+            'username': await self.read_input("Username: "),
+        })
+
+        error = self._validate_new_user(user_data)
+        if error:
+            print(f"\nError adding user: {error}")
+            await self.wait_for_user()
+            return
 
         # Multiline fields
-        user_data['cv_text'] = self.get_multiline_input("\nCV Text")
-        user_data['contact_info'] = self.get_multiline_input("\nContact Info")
+        user_data['cv_text'] = await self.get_multiline_input("\nCV Text")
+        user_data['contact_info'] = await self.get_multiline_input("\nContact Info")
 
         try:
             user = await self.user_manager.add_user(**user_data)
+            # IDs only grow, so inserting last keeps the listing ordered
+            if self._users is not None:
+                self._users[user.id] = (user.id, user.first_name, user.last_name, user.email)
+                self._emails.add(user.email)
             print(f"\nUser added successfully with ID: {user.id}")
         except Exception as e:
             print(f"\nError adding user: {e}")
         await self.wait_for_user()
 
+    def _validate_new_user(self, user_data: dict) -> Optional[str]:
+        """
+        Cheap checks run before the insert so common mistakes never reach the database.
+        Returns:
+            Optional[str]: Error message, or None if the data looks valid.
+        """
+        if not 3 <= len(user_data['username']) <= 64:
+            return "Username must be between 3 and 64 characters."
+        if not _EMAIL_RE.fullmatch(user_data['email']):
+            return f"Invalid email address: {user_data['email']}"
+        return None
+
     async def delete_user(self):
         try:
-            user_id = int(input("\nEnter user ID to delete: "))
+            user_id = int(await self.read_input("\nEnter user ID to delete: "))
+            # The cache may miss users created elsewhere, the database decides
             if await self.user_manager.delete_user(user_id):
+                if self._users is not None:
+                    removed = self._users.pop(user_id, None)
+                    if removed:
+                        self._emails.discard(removed[3])
                 print(f"User {user_id} deleted successfully")
             else:
                 print(f"User {user_id} not found")
@@ -143,12 +223,13 @@ class UserMenu(BaseMenu):
     async def manage_preferences(self):
         """Manage user preferences"""
         try:
-            user_id = int(input("\nEnter user ID: "))
+            user_id = int(await self.read_input("\nEnter user ID: "))
             user = await self.user_manager.get_user_by_id(user_id)
             if not user:
                 print(f"\nUser with ID {user_id} not found")
                 await self.wait_for_user()
                 return
+            self._cache_user(user)
 
             print("\nCurrent preferences:")
             if user.preferences:
@@ -157,7 +238,7 @@ class UserMenu(BaseMenu):
                 print("No preferences set")
 
             print("\nEnter new preferences:")
-            preferences_text = self.get_multiline_input("Enter your job preferences (skills, industries, roles, etc.)")
+            preferences_text = await self.get_multiline_input("Enter your job preferences (skills, industries, roles, etc.)")
 
             try:
                 await self.user_manager.add_preferences(user_id, preferences_text)
@@ -1,9 +1,12 @@
-from typing import Tuple
+from typing import Tuple, Optional
 from datetime import date
 import os
 import locale
 from io import BytesIO
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 
 from babel.dates import format_date
 from langdetect import detect
@@ -23,21 +26,12 @@ from data.managers.cover_letter_manager import CoverLetterManager
 from data.database import get_app_data_dir
 
 
-class PDFCoverLetterGenerator:
-    def __init__(self, session: Session):
-        self.session = session
-        self.user_manager = UserManager(self.session)
-        self.job_offer_manager = JobOfferManager(self.session)
-        self.cover_letter_manager = CoverLetterManager(self.session)
+class LetterRenderer:
+    """Lays out cover letters as PDFs. Holds no database state, so it can run in worker processes."""
 
-        self.config_path = get_app_data_dir() / "config"
-        if not os.path.exists(self.config_path / "fonts"):
-            os.makedirs(self.config_path)
-        self.fonts_dir = os.path.join(self.config_path, "fonts")
-        if os.path.exists(self.config_path / "fonts"):
-            self.signature_path = os.path.join(self.config_path, "signature.png")
-        else:
-            self.signature_path = None
+    def __init__(self, fonts_dir: str, signature_path: Optional[str]):
+        self.fonts_dir = fonts_dir
+        self.signature_path = signature_path
         self._register_fonts()
 
     def _register_fonts(self):
@@ -98,108 +92,38 @@ class PDFCoverLetterGenerator:
                 return f"{city}, {date_en}"
             return date_en
 
-    def _count_pdf_pages(self, pdf_data: bytes) -> int:
+    def _count_pdf_pages(self, pdf_stream: BytesIO) -> int:
         """Count the number of pages in a PDF byte stream."""
-        pdf_stream = BytesIO(pdf_data)
+        pdf_stream.seek(0)
         pdf = PdfReader(pdf_stream)
         return len(pdf.pages)
 
-    def _sanitize_filename(self, filename: str) -> str:
-        """Cleans the filename of forbidden characters."""
-        # Characters forbidden in most file systems
-        forbidden_chars = '<>:"/\\|?*'
-        # Replace forbidden characters with underscore
-        for char in forbidden_chars:
-            filename = filename.replace(char, '_')
-        # Remove spaces at start and end
-        filename = filename.strip()
-        # Replace multiple spaces with single underscore
-        filename = '_'.join(filter(None, filename.split()))
-        return filename
-
-    async def generate_cover_letter_pdf(self, user_id: int, job_id: int) -> Tuple[bool, str]:
-        """Generate a PDF cover letter, ensuring it is exactly one page."""
-        # Get data from database
-        user = await self.user_manager.get_user_by_id(user_id)
-        job_offer = await self.job_offer_manager.get_job_offer_by_id(job_id)
-        cover_letter = await self.cover_letter_manager.get_cover_letter_by_user_and_job_id(user_id, job_id)
-
-        if not user or not job_offer or not cover_letter:
-            return False, "Missing data for generating cover letter PDF."
-
-        # Prepare letter data
-        data = {
-            "sender": f"{user.contact_info}",
-            "recipient": cover_letter.recipient_info,
-            "subject": cover_letter.subject,
-            "body": (
-                f"{cover_letter.greeting}\n\n"
-                f"{cover_letter.introduction}\n\n"
-                f"{cover_letter.skills_experience}\n\n"
-                f"{cover_letter.motivation}\n\n"
-                f"{cover_letter.conclusion}\n\n"
-                f"{cover_letter.closing}"
-            ),
-            "filename": self._sanitize_filename(f"Cover_Letter_{user.last_name}_{job_offer.company_name}.pdf")
-        }
+    def render(self, data: dict) -> Optional[bytes]:
+        """Render the letter, trying smaller fonts until it fits exactly one page."""
+        # The date line does not depend on the font size, detect the language only once
+        sender_lines = data["sender"].split('\n')
+        city = sender_lines[2].split(' ', 1)[1] if len(sender_lines) > 2 else None
+        date_text = self._format_date(detect(data["body"]), city)
 
-        # Try different font sizes until the letter fits exactly one page
         for font_size in [12, 11, 10]:
             # Create styles with current font size
             styles = self._create_styles(font_size)
 
             # Generate PDF content
-            letter_content = self._create_letter_content(data, styles)
+            letter_content = self._create_letter_content(data, styles, date_text)
 
             # Generate PDF in memory
             buffer = BytesIO()
             self._build_pdf(letter_content, buffer, data["filename"])
 
-            # Get PDF data and check number of pages
-            pdf_data = buffer.getvalue()
-            num_pages = self._count_pdf_pages(pdf_data)
+            # Check the number of pages on the buffer, copy out only the accepted PDF
+            with buffer:
+                if self._count_pdf_pages(buffer) == 1:
+                    return buffer.getvalue()
 
-            if num_pages == 1:
-                # PDF is exactly one page, save it
-                await self.cover_letter_manager.add_pdf_to_cover_letter(cover_letter.id, pdf_data)
-                buffer.close()
-                return True, "Cover letter generated successfully"
+        return None
 
-            buffer.close()
-
-        return False, "Could not fit cover letter to exactly one page even with minimum font size"
-
-    async def generate_cover_letters_batch(self, user_id: int, job_ids: list[int], max_concurrent: int = 3):
-        """Generate multiple cover letters concurrently."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def generate_with_semaphore(job_id: int):
-            async with semaphore:
-                return await self.generate_cover_letter_pdf(user_id, job_id)
-
-        tasks = [generate_with_semaphore(job_id) for job_id in job_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        successful = 0
-        failed = 0
-
-        for result in results:
-            if isinstance(result, Exception):
-                failed += 1
-            else:
-                success, _ = result
-                if success:
-                    successful += 1
-                else:
-                    failed += 1
-
-        return {
-            "successful": successful,
-            "failed": failed,
-            "total": len(job_ids)
-        }
-
-    def _create_letter_content(self, data: dict, styles: dict) -> list:
+    def _create_letter_content(self, data: dict, styles: dict, date_text: str) -> list:
         """Create the content elements for the PDF."""
         letter_content = []
 
@@ -218,9 +142,6 @@ class PDFCoverLetterGenerator:
         letter_content.append(Spacer(1, 0.8 * cm))  # Reduced spacing
 
         # 3. Date
-        lang = detect(data["body"])
-        city = sender_lines[2].split(' ', 1)[1] if len(sender_lines) > 2 else None
-        date_text = self._format_date(lang, city)
         letter_content.append(Paragraph(date_text, styles['Indented']))
         letter_content.append(Spacer(1, 2.0 * cm))  # Increased spacing between date and subject
 
@@ -271,4 +192,158 @@ class PDFCoverLetterGenerator:
         )
 
         # Build the PDF
-        doc.build(letter_content)
\ No newline at end of file
+        doc.build(letter_content)
+
+
+@lru_cache(maxsize=None)
+def _get_renderer(fonts_dir: str, signature_path: Optional[str]) -> LetterRenderer:
+    # Fonts are registered once per worker process
+    return LetterRenderer(fonts_dir, signature_path)
+
+
+def _render_letter_pdf(fonts_dir: str, signature_path: Optional[str], data: dict) -> Optional[bytes]:
+    """Worker process entry point: the one-page PDF of the letter, or None if it does not fit."""
+    return _get_renderer(fonts_dir, signature_path).render(data)
+
+
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pdf_executor
+
+
+def _discard_pdf_executor(executor: ProcessPoolExecutor) -> None:
+    """Drops a broken pool so the next call builds a fresh one."""
+    global _pdf_executor
+    if _pdf_executor is executor:
+        _pdf_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_executor() -> None:
+    """Stops the PDF worker processes, called when the application exits."""
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(wait=True, cancel_futures=True)
+        _pdf_executor = None
+
+
+class PDFCoverLetterGenerator:
+    def __init__(self, session: Session):
+        self.session = session
+        self.user_manager = UserManager(self.session)
+        self.job_offer_manager = JobOfferManager(self.session)
+        self.cover_letter_manager = CoverLetterManager(self.session)
+
+        self.config_path = get_app_data_dir() / "config"
+        if not os.path.exists(self.config_path / "fonts"):
+            os.makedirs(self.config_path)
+        self.fonts_dir = os.path.join(self.config_path, "fonts")
+        if os.path.exists(self.config_path / "fonts"):
+            self.signature_path = os.path.join(self.config_path, "signature.png")
+        else:
+            self.signature_path = None
+
+    def _sanitize_filename(self, filename: str) -> str:
+        """Cleans the filename of forbidden characters."""
+        # Characters forbidden in most file systems
+        forbidden_chars = '<>:"/\\|?*'
+        # Replace forbidden characters with underscore
+        for char in forbidden_chars:
+            filename = filename.replace(char, '_')
+        # Remove spaces at start and end
+        filename = filename.strip()
+        # Replace multiple spaces with single underscore
+        filename = '_'.join(filter(None, filename.split()))
+        return filename
+
+    async def generate_cover_letter_pdf(self, user_id: int, job_id: int, commit: bool = True) -> Tuple[bool, str]:
+        """Generate a PDF cover letter, ensuring it is exactly one page.
+        With commit=False the PDF is only added to the session, for the caller to commit."""
+        # Get data from database
+        user = await self.user_manager.get_user_by_id(user_id)
+        job_offer = await self.job_offer_manager.get_job_offer_by_id(job_id)
+        cover_letter = await self.cover_letter_manager.get_cover_letter_by_user_and_job_id(user_id, job_id)
+
+        if not user or not job_offer or not cover_letter:
+            return False, "Missing data for generating cover letter PDF."
+
+        # Prepare letter data
+        data = {
+            "sender": f"{user.contact_info}",
+            "recipient": cover_letter.recipient_info,
+            "subject": cover_letter.subject,
+            "body": (
+                f"{cover_letter.greeting}\n\n"
+                f"{cover_letter.introduction}\n\n"
+                f"{cover_letter.skills_experience}\n\n"
+                f"{cover_letter.motivation}\n\n"
+                f"{cover_letter.conclusion}\n\n"
+                f"{cover_letter.closing}"
+            ),
+            "filename": self._sanitize_filename(f"Cover_Letter_{user.last_name}_{job_offer.company_name}.pdf")
+        }
+
+        # Lay out the letter in a worker process, trying smaller fonts until it fits one page
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = _get_pdf_executor()
+            try:
+                pdf_data = await loop.run_in_executor(
+                    executor, _render_letter_pdf, self.fonts_dir, self.signature_path, data
+                )
+                break
+            except BrokenProcessPool:
+                # A worker died (OOM, crash in ReportLab): rebuild the pool and retry once
+                _discard_pdf_executor(executor)
+                if attempt:
+                    raise
+        if pdf_data is None:
+            return False, "Could not fit cover letter to exactly one page even with minimum font size"
+
+        await self.cover_letter_manager.add_pdf_to_cover_letter(cover_letter.id, pdf_data, commit=commit)
+        return True, "Cover letter generated successfully"
+
+    async def generate_cover_letters_batch(self, user_id: int, job_ids: list[int], max_concurrent: int = 3):
+        """Generate multiple cover letters concurrently and save them in a single commit."""
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def generate_with_semaphore(job_id: int):
+            async with semaphore:
+                return await self.generate_cover_letter_pdf(user_id, job_id, commit=False)
+
+        tasks = [generate_with_semaphore(job_id) for job_id in job_ids]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            return {
+                "successful": 0,
+                "failed": len(job_ids),
+                "total": len(job_ids)
+            }
+
+        successful = 0
+        failed = 0
+
+        for result in results:
+            if isinstance(result, Exception):
+                failed += 1
+            else:
+                success, _ = result
+                if success:
+                    successful += 1
+                else:
+                    failed += 1
+
+        return {
+            "successful": successful,
+            "failed": failed,
+            "total": len(job_ids)
+        }
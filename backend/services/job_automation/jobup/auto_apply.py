@@ -6,6 +6,7 @@ from data.managers.application_manager import ApplicationManager
 from services.generation.generator import CoverLetterGenerator
 from services.generation.pdf_builder import PDFCoverLetterGenerator
 from services.job_automation.jobup.form_filler import FormFiller
+from services.job_automation.jobup.login import BrowserSession
 import asyncio
 from typing import List, Dict, Optional
 from dataclasses import dataclass
@@ -31,28 +32,20 @@ class AutoApply:
         self.cover_letter_generator = CoverLetterGenerator(session)
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    async def get_pending_quick_apply_jobs(self) -> List:
+    async def get_pending_quick_apply_jobs(self, limit: Optional[int] = None) -> List:
         """
         Get all quick_apply jobs that haven't been applied to yet.
 
+        Args:
+            limit: Maximum number of jobs to return, all of them if None
+
         Returns:
             List of job offers that are quick_apply enabled and not yet applied to
         """
-        job_offers = await self.job_offer_manager.get_job_offers_by_quick_apply()
-        pending_jobs = []
-
-        for job in job_offers:
-            existing = await self.application_manager.get_application_by_user_and_job(
-                user_id=self.user_id,
-                job_id=job.id
-            )
-            if not existing:
-                pending_jobs.append(job)
-
-        return pending_jobs
+        return await self.job_offer_manager.get_pending_quick_apply_offers(self.user_id, limit=limit)
 
-    async def process_single_job(self, job_offer) -> ApplicationResult:
-        """Process a single job offer asynchronously."""
+    async def process_single_job(self, job_offer, browser_session: Optional[BrowserSession] = None) -> ApplicationResult:
+        """Process a single job offer asynchronously, on a shared browser session if given."""
         result = ApplicationResult(
             job_id=job_offer.id,
             company_name=job_offer.company_name,
@@ -83,7 +76,7 @@ class AutoApply:
                 result.error = f"PDF generation failed: {message}"
                 return result
 
-            form_filler = FormFiller(self.session, self.user_id)
+            form_filler = FormFiller(self.session, self.user_id, browser_session=browser_session)
             try:
                 await form_filler.fill_apply_form(job_offer.external_id)
             except Exception as e:
@@ -119,11 +112,8 @@ class AutoApply:
         Process multiple job offers concurrently with improved error handling and reporting.
         If max_applications is None, process all pending quick_apply jobs.
         """
-        # Get all pending quick_apply jobs
-        jobs_to_process = await self.get_pending_quick_apply_jobs()
-
-        if max_applications is not None:
-            jobs_to_process = jobs_to_process[:max_applications]
+        # Get the pending quick_apply jobs, no more than max_applications
+        jobs_to_process = await self.get_pending_quick_apply_jobs(limit=max_applications)
 
         if not jobs_to_process:
             return {
@@ -141,13 +131,19 @@ class AutoApply:
         # Process jobs with concurrency control
         semaphore = asyncio.Semaphore(max_concurrent)
 
+        # One browser for the whole run, each job gets its own context
+        browser_session = BrowserSession(self.session, self.user_id)
+
         async def process_with_semaphore(job):
             async with semaphore:
-                return await self.process_single_job(job)
+                return await self.process_single_job(job, browser_session)
 
         # Execute all tasks
         tasks = [process_with_semaphore(job) for job in jobs_to_process]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await browser_session.close()
 
         # Process results
         processed_results = []
@@ -194,20 +190,17 @@ class AutoApply:
             - application_results: Results of processing pending applications
         """
         try:
-            # Get all quick apply jobs
-            all_quick_apply = await self.job_offer_manager.get_job_offers_by_quick_apply()
-            total_quick_apply = len(all_quick_apply)
-
-            # Get pending jobs (not yet applied to)
-            pending_jobs = await self.get_pending_quick_apply_jobs()
-            already_applied = total_quick_apply - len(pending_jobs)
+            # Count quick apply jobs and pending ones (not yet applied to)
+            total_quick_apply = await self.job_offer_manager.count_job_offers(quick_apply_only=True)
+            pending = await self.job_offer_manager.count_pending_quick_apply_offers(self.user_id)
+            already_applied = total_quick_apply - pending
 
             self.logger.info(f"Found {total_quick_apply} quick_apply jobs total")
             self.logger.info(f"Already applied to {already_applied} jobs")
-            self.logger.info(f"Found {len(pending_jobs)} pending jobs to process")
+            self.logger.info(f"Found {pending} pending jobs to process")
 
             # Process pending jobs if any
-            if pending_jobs:
+            if pending:
                 application_results = await self.process_job_offers()
             else:
                 application_results = {
@@ -224,7 +217,7 @@ class AutoApply:
             return {
                 "total_quick_apply": total_quick_apply,
                 "already_applied": already_applied,
-                "pending": len(pending_jobs),
+                "pending": pending,
                 "application_results": application_results
             }
 
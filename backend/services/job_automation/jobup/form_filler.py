@@ -1,4 +1,3 @@
-from playwright.async_api import async_playwright
 from sqlmodel import Session
 from data.managers.apply_form_manager import ApplyFormManager
 from data.managers.document_manager import DocumentManager
@@ -7,13 +6,11 @@ from data.managers.job_offer_manager import JobOfferManager
 from data.managers.application_manager import ApplicationManager
 from .login import BrowserSession
 from langdetect import detect
-import tempfile
-from pathlib import Path
-import os
+import mimetypes
 import time
 import asyncio
 import logging
-import aiofiles
+from typing import Optional
 
 
 class FormChecker:
@@ -224,10 +221,13 @@ class FormChecker:
 
 
 class FormFiller:
-    def __init__(self, session: Session, user_id: int, log_level=logging.INFO):
+    def __init__(self, session: Session, user_id: int, log_level=logging.INFO,
+                 browser_session: Optional[BrowserSession] = None):
         self.user_id = user_id
         self.session = session
-        self.browser_session = BrowserSession(session, user_id)
+        # A browser session passed in by the caller is shared and closed by its owner
+        self._owns_browser_session = browser_session is None
+        self.browser_session = browser_session or BrowserSession(session, user_id)
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(log_level)
         self.apply_manager = ApplyFormManager(session)
@@ -254,18 +254,6 @@ class FormFiller:
         except Exception as e:
             self.logger.error(f"Unable to click on {selector}: {e}")
 
-    async def safe_file_cleanup(self, temp_file, max_attempts=3, delay=1):
-        """Attempts to delete a temporary file."""
-        for attempt in range(max_attempts):
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    return True
-            except PermissionError:
-                self.logger.warning(f"File {temp_file} still in use, attempt {attempt + 1}/{max_attempts}")
-                time.sleep(delay)
-        return False
-
     async def create_form_data(self, firstname, lastname, email, phone, zipcode,
                              gender, availability, work_permit, auto_answer_requirements="true"):
         """
@@ -412,18 +400,14 @@ class FormFiller:
             except Exception as e:
                 self.logger.error(f"Error while filling {field}: {e}")
 
-    async def fill_missing_files(self, page, files_to_upload) -> list:
+    async def fill_missing_files(self, page, files_to_upload):
         """
         Handles upload of missing files.
 
         Args:
             page: The Playwright page
             files_to_upload: List of tuples (file_type, filename, content)
-
-        Returns:
-            list: List of created temporary file paths
         """
-        tempfiles = []
         try:
             # Determine available document sections
             available_sections = {
@@ -446,56 +430,38 @@ class FormFiller:
                 section_head = f"div[data-cy='document-section-head-{file["type"]}']"
                 section_input = f"div[data-cy='document-section-{file["type"]}'] input[type='file']"
 
-                temp_path = await self.upload_bytes_to_field(
+                await self.upload_bytes_to_field(
                     page, file["name"], file["bytes"],
                     section_head,
                     section_input
                 )
-                tempfiles.append(temp_path)
-
-            return tempfiles
 
         except Exception as e:
             self.logger.error(f"Error while uploading files: {e}")
-            # Cleanup temporary files in case of error
-            for temp_file in tempfiles:
-                await self.safe_file_cleanup(temp_file)
             raise
 
     async def upload_bytes_to_field(self, page, filename: str, file_bytes: bytes, selector_button: str, selector_file: str):
         """
         Uploads a file from bytes to an input[type='file'] field.
-        Returns created temporary file path.
+        The content is handed to Playwright as an in-memory payload, nothing is written to disk.
         """
-        temp_dir = Path(tempfile.gettempdir())
-        temp_file_path = temp_dir / filename
+        payload = {
+            "name": filename,
+            "mimeType": mimetypes.guess_type(filename)[0] or "application/octet-stream",
+            "buffer": file_bytes
+        }
 
         try:
-            try:
-                if temp_file_path.exists():
-                    self.logger.info(f"Temporary file {temp_file_path} already exists, deleting it.")
-                    await asyncio.to_thread(temp_file_path.unlink)
-            except Exception as e:
-                self.logger.error(f"Error while deleting temporary file {temp_file_path}: {e}")
-
-            async with aiofiles.open(temp_file_path, 'wb') as f:
-                await f.write(file_bytes)
-                await f.flush()
-                await asyncio.to_thread(os.fsync, f.fileno())
-
             await page.wait_for_selector(selector_button, state="visible", timeout=10000)
             await self.safe_click(page, selector_button)
 
             await page.wait_for_selector(selector_file, state="attached", timeout=10000)
-            await page.set_input_files(selector_file, str(temp_file_path))
+            await page.set_input_files(selector_file, payload)
 
             self.logger.info(f"Upload completed: {filename}")
-            return temp_file_path
 
         except Exception as e:
             self.logger.error(f"Error while uploading {filename}: {e}")
-            if os.path.exists(temp_file_path):
-                await asyncio.to_thread(os.remove, temp_file_path)
             raise
 
     async def fill_apply_form(self, external_id, direct_apply: bool = False):
@@ -571,15 +537,14 @@ class FormFiller:
         max_attempts = 3
         current_attempt = 0
 
-        async with async_playwright() as p:
-            context = await self.browser_session.get_browser_context(p, headless=True)
+        context = await self.browser_session.new_headless_context()
+        try:
             page = await context.new_page()
             form_checker = FormChecker(page)
 
             while current_attempt < max_attempts:
                 current_attempt += 1
                 self.logger.info(f"Attempt {current_attempt}/{max_attempts} to fill JobUp form.")
-                tempfiles = []
 
                 try:
                     await page.goto(f"https://www.jobup.ch/fr/application/create/{external_id}/", wait_until="load")
@@ -620,7 +585,7 @@ class FormFiller:
 
 
                     if missing_files:
-                        tempfiles = await self.fill_missing_files(page, missing_files)
+                        await self.fill_missing_files(page, missing_files)
 
                     if missing_fields:
                         await self.fill_missing_fields(page, form_data, missing_fields)
@@ -634,21 +599,14 @@ class FormFiller:
                         self.logger.info("Form completed successfully, submitting application.")
                         await self.click_submit_button(page, direct_apply)
                         await page.wait_for_load_state("networkidle", timeout=30000)
-
-                        for temp_file in tempfiles:
-                            if not await self.safe_file_cleanup(temp_file):
-                                self.logger.error(f"Unable to delete {temp_file}")
-
                         break
 
                 except Exception as e:
                     self.logger.error(f"Error during attempt {current_attempt}: {str(e)}")
                     if current_attempt >= max_attempts:
                         raise
-                finally:
-
-                    for temp_file in tempfiles:
-                        await self.safe_file_cleanup(temp_file)
+        finally:
+            await context.close()
 
     async def click_submit_button(self, page, direct_apply: bool = False):
         """
@@ -669,7 +627,7 @@ class FormFiller:
 
     async def close(self):
         """Cleanup resources held by FormFiller (e.g., close browser session)."""
-        if hasattr(self.browser_session, "close"):
+        if self._owns_browser_session and hasattr(self.browser_session, "close"):
             closing = self.browser_session.close()
             if asyncio.iscoroutine(closing):
                 await closing
@@ -1,5 +1,7 @@
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from pathlib import Path
+import asyncio
+import json
 import logging
 from typing import Optional, Tuple
 from data.managers.browser_cache_manager import BrowserCacheManager
@@ -10,13 +12,32 @@ from sqlmodel import Session
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--no-sandbox"
+]
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+_VIEWPORT = {'width': 1280, 'height': 800}
+
+# Disable WebDriver
+_STEALTH_JS = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+    window.navigator.chrome = { runtime: {} };
+"""
+
 class BrowserSession:
     def __init__(self, session: Session, user_id: int):
         self.session = session
         self.user_id = user_id
         self.cache_manager = BrowserCacheManager(session)
         self.cache_dir = self._get_cache_dir()
+        self._state_path = self.cache_dir / "state.json"
         self.login_url = "https://www.jobup.ch"
+        self.browser = None
+        self.playwright = None
+        # Guards the lazy Playwright start and browser launch when concurrent jobs share this session
+        self._launch_lock = asyncio.Lock()
 
     def _get_cache_dir(self) -> Path:
         """Returns the cache folder path based on OS"""
@@ -24,30 +45,73 @@ class BrowserSession:
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
-    async def _setup_browser_context(self, playwright):
-        """Configure and return browser context"""
-        browser = await playwright.chromium.launch(
-            headless=False,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-extensions",
-                "--no-sandbox"
-            ]
-        )
-
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={'width': 1280, 'height': 800},
-            storage_state=str(self.cache_dir / "state.json") if (self.cache_dir / "state.json").exists() else None
-        )
-
-        # Disable WebDriver
-        await context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-            window.navigator.chrome = { runtime: {} };
-        """)
-
-        return browser, context
+    async def _setup_browser_context(self, playwright, headless: bool = False):
+        """
+        Configure and return browser context.
+
+        The visible login browser runs on the persistent user profile, where Chromium
+        keeps cookies, localStorage and IndexedDB itself. Headless contexts may run
+        concurrently for the same user and cannot open the locked profile, so they are
+        created on a shared browser from the exported storage state instead.
+        """
+        if headless:
+            async with self._launch_lock:
+                if self.browser is None or not self.browser.is_connected():
+                    self.browser = await playwright.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+            state_str = str(self._state_path) if self._state_path.exists() else None
+            context = await self.browser.new_context(
+                user_agent=_USER_AGENT,
+                viewport=_VIEWPORT,
+                storage_state=state_str
+            )
+        else:
+            # Archives saved before the persistent profile only hold state.json
+            seed_from_state = not (self.cache_dir / "Default").exists() and self._state_path.exists()
+            context = await playwright.chromium.launch_persistent_context(
+                user_data_dir=str(self.cache_dir),
+                headless=False,
+                args=_LAUNCH_ARGS,
+                user_agent=_USER_AGENT,
+                viewport=_VIEWPORT
+            )
+            if seed_from_state:
+                await self._seed_cookies_from_state(context)
+
+        await context.add_init_script(_STEALTH_JS)
+        return context
+
+    async def _seed_cookies_from_state(self, context):
+        """Load the cookies of an exported storage state into a new persistent profile"""
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+            cookies = state.get("cookies", [])
+            if cookies:
+                await context.add_cookies(cookies)
+                logger.info(f"Seeded new browser profile with {len(cookies)} cookies from saved state")
+        except Exception as e:
+            logger.warning(f"Could not seed browser profile from {self._state_path}: {e}")
+
+    async def new_headless_context(self):
+        """
+        Return a new headless context on the browser owned by this session.
+
+        Playwright and Chromium are started on first use and kept until close(),
+        so every form filled through this session shares one browser process.
+        """
+        async with self._launch_lock:
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+        return await self._setup_browser_context(self.playwright, headless=True)
+
+    async def close(self):
+        """Close the shared headless browser and stop Playwright"""
+        async with self._launch_lock:
+            if self.browser is not None:
+                await self.browser.close()
+                self.browser = None
+            if self.playwright is not None:
+                await self.playwright.stop()
+                self.playwright = None
 
     async def is_logged_in(self, page) -> bool:
         """Check if user is logged in"""
@@ -58,38 +122,10 @@ class BrowserSession:
         except PlaywrightTimeout:
             return False
 
-    async def get_browser_context(self, playwright, headless=False):
-        """Return browser context"""
-        browser = await playwright.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-extensions",
-                "--no-sandbox"
-            ]
-        )
-
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={'width': 1280, 'height': 800},
-            storage_state=str(self.cache_dir / "state.json") if (self.cache_dir / "state.json").exists() else None
-        )
-
-        # Disable WebDriver
-        await context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-            window.navigator.chrome = { runtime: {} };
-        """)
-
-        return context
-
-    async def save_session(self, context) -> bool:
+    async def save_session(self) -> bool:
         """Save session state"""
         try:
-            # Save context state
-            await context.storage_state(path=str(self.cache_dir / "state.json"))
-
-            # Save cache in database
+            # Save profile directory in database
             if await self.cache_manager.save_cache_directory(self.user_id, str(self.cache_dir)):
                 logger.info("Session saved successfully")
                 return True
@@ -101,6 +137,9 @@ class BrowserSession:
     async def restore_session(self) -> bool:
         """Restore previous session"""
         try:
+            # A profile left on disk by a previous run is already up to date
+            if (self.cache_dir / "Default").exists():
+                return True
             return await self.cache_manager.extract_cache_directory(self.user_id, str(self.cache_dir))
         except Exception as e:
             logger.error(f"Error while restoring session: {e}")
@@ -113,41 +152,44 @@ class BrowserSession:
             await self.restore_session()
 
             async with async_playwright() as p:
-                browser, context = await self._setup_browser_context(p)
-                page = await context.new_page()
-
-                # Navigate to login page
-                logger.info(f"Navigating to {self.login_url}")
-                await page.goto(self.login_url)
-                await page.wait_for_load_state("networkidle")
-
-                # Check if already logged in
-                if await self.is_logged_in(page):
-                    logger.info("User already logged in")
-                    await self.save_session(context)
-                    return True, "Already logged in"
-
-                logger.info("Waiting for manual login...")
-                print("Please login manually...")
-
-                # Wait for user to login
+                context = await self._setup_browser_context(p)
                 try:
-                    await page.wait_for_selector(
-                        "div[data-cy='offcanvas-menu-trigger']",
-                        timeout=300000  # 5 minutes timeout
-                    )
-                    logger.info("Login successful")
-
-                    # Save session
-                    if await self.save_session(context):
-                        return True, "Login successful"
-                    return False, "Failed to save session"
-
-                except PlaywrightTimeout:
-                    return False, "Login timeout"
+                    page = context.pages[0] if context.pages else await context.new_page()
+
+                    # Navigate to login page
+                    logger.info(f"Navigating to {self.login_url}")
+                    await page.goto(self.login_url)
+                    await page.wait_for_load_state("networkidle")
+
+                    # Check if already logged in
+                    if await self.is_logged_in(page):
+                        logger.info("User already logged in")
+                        message = "Already logged in"
+                    else:
+                        logger.info("Waiting for manual login...")
+                        print("Please login manually...")
+
+                        # Wait for user to login
+                        try:
+                            await page.wait_for_selector(
+                                "div[data-cy='offcanvas-menu-trigger']",
+                                timeout=300000  # 5 minutes timeout
+                            )
+                            logger.info("Login successful")
+                            message = "Login successful"
+                        except PlaywrightTimeout:
+                            return False, "Login timeout"
+
+                    # Headless contexts cannot open the locked profile, they start from this state
+                    await context.storage_state(path=str(self._state_path))
 
                 finally:
-                    await browser.close()
+                    await context.close()
+
+            # Archive the profile once Chromium has flushed and released it
+            if await self.save_session():
+                return True, message
+            return False, "Failed to save session"
 
         except Exception as e:
             error_msg = f"Error during browser session: {e}"
@@ -169,7 +211,6 @@ async def launch_browser_and_save_session(user_id: int, session: Session) -> Tup
     return await browser_session.launch_browser_session()
 
 if __name__ == "__main__":
-    import asyncio
     from sqlmodel import Session, create_engine
 
     async def main():
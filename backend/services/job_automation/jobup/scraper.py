@@ -1,12 +1,16 @@
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from selectolax.parser import HTMLParser
 from typing import List, Optional
 from sqlmodel import Session
 from data.managers.job_offer_manager import JobOfferManager
 import asyncio
 import re
 import logging
-from collections import deque
-import uuid
+from urllib.parse import urlencode
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+import httpx
 
 # Logging configuration
 logging.basicConfig(
@@ -19,6 +23,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_BROWSER_ARGS = ["--disable-gpu", "--no-sandbox"]
+# Resources never read by the scraper
+_BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet", "other"}
+# Job IDs of the listing items in the raw HTML of a search page
+_SERP_RE = re.compile(r'data-cy="serp-item-([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"')
+_UUID_RE = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.I)
+_PAGENUM_RE = re.compile(r"\d+")
+_PAGINATION_SELECTOR = 'div.d_flex.ai_center.gap_s4'
+# Marks block element boundaries so multiline fields keep their line breaks after whitespace is normalised
+_BLOCK_BREAK = "\u2029"
+_BLOCK_TAG_RE = re.compile(
+    r"<(?:br|/?(?:p|div|li|ul|ol|h[1-6]|section|article|blockquote|pre|header|footer))\b[^>]*>", re.I
+)
+_HTTP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+@lru_cache(maxsize=1024)
+def _build_url(base_url: str, page: Optional[int], jobid: Optional[str], term: Optional[str],
+               employment_grade_min: Optional[int], employment_grade_max: Optional[int],
+               publication_date: Optional[int], category: Optional[tuple],
+               benefit: Optional[int], region: Optional[tuple]) -> str:
+    """Builds a search URL; memoized since every page of a search shares its filters."""
+    params = {
+        "page": page,
+        "jobid": jobid,
+        "term": term,
+        "employment-grade-min": employment_grade_min,
+        "employment-grade-max": employment_grade_max,
+        "publication-date": publication_date,
+        "category": category,
+        "benefit": benefit,
+        "region": region,
+    }
+    query = urlencode({k: v for k, v in params.items() if v is not None and v != ""}, doseq=True)
+
+    if query:
+        return f"{base_url}?{query}"
+    return base_url
+
+def _parse_detail_html(html: str) -> dict:
+    """
+    Reads the fields of a detail page from its HTML.
+
+    Args:
+        html (str): HTML of the detail page.
+
+    Returns:
+        dict: Raw field values keyed by job offer column.
+    """
+    tree = HTMLParser(_BLOCK_TAG_RE.sub(lambda m: _BLOCK_BREAK + m.group(0), html))
+
+    def inline_text(node) -> Optional[str]:
+        # Text nodes are joined with a space and all whitespace, block breaks included, collapsed
+        return " ".join(node.text(separator=" ").split()) or None
+
+    def block_text(node) -> Optional[str]:
+        lines = (" ".join(line.split()) for line in node.text(separator=" ").split(_BLOCK_BREAK))
+        return "\n".join(line for line in lines if line) or None
+
+    def q(selector: str, multiline: bool = False) -> Optional[str]:
+        node = tree.css_first(selector)
+        if node is None:
+            return None
+        return block_text(node) if multiline else inline_text(node)
+
+    def location_from_icon() -> Optional[str]:
+        # The location item is only identifiable by the path of its pin icon
+        for item in tree.css("li"):
+            if item.css_first("svg path[d^='M12 12c']"):
+                node = item.css_first(".fw_semibold + span")
+                if node:
+                    return inline_text(node)
+        return None
+
+    company_url = tree.css_first("[data-cy='company-url']")
+    return {
+        "job_title": q("[data-cy='vacancy-title']"),
+        "company_name": q("[data-cy='vacancy-logo']") or q(".grid-area_company"),
+        "posted_date": q("[data-cy='info-publication']"),
+        "activity_rate": q("[data-cy='info-workload']"),
+        "contract_type": q("[data-cy='info-contract']"),
+        "work_location": q("[data-cy='info-location-link']") or location_from_icon(),
+        "company_info": q("[data-cy='vacancy-lead'] p"),
+        "company_contact": q("[data-cy='vacancy-contact']", multiline=True),
+        "company_url": company_url.attributes.get("href") if company_url else None,
+        "categories": [text for text in (inline_text(a) for a in tree.css("[data-cy='vacancy-meta'] a")) if text],
+        "quick_apply": tree.css_first("[data-cy='dynamic-application-button']") is not None,
+        "job_description": q("[data-cy='vacancy-description']", multiline=True)
+                           or q("main", multiline=True) or q("article", multiline=True)
+                           or q(".content", multiline=True),
+    }
+
+async def _block_static_resources(route):
+    """Aborts requests for resources the scraper does not need."""
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+@dataclass
+class ScrapeRun:
+    """State of one start_scraping call, so that several searches can share a scraper."""
+    base_query: str
+    page_sep: str
+    # Bounded so listing pages wait for the detail workers to catch up
+    job_ids_queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=200))
+    # Parsed job offers waiting for the database writer
+    db_q: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=500))
+    enqueued_ids: set = field(default_factory=set)  # job IDs queued during this search
+
 class JobScraper:
     def __init__(self, session: Session, language: str = "fr",
                  max_browsers: int = 10, debug_level: str = "INFO"):
@@ -28,7 +141,7 @@ class JobScraper:
         Args:
             session (Session): SQLModel session for database operations.
             language (str): Language for the job listings.
-            max_browsers (int): Maximum number of browsers to run in parallel.
+            max_browsers (int): Maximum number of browser contexts to run in parallel.
             debug_level (str): Logging level.
         """
         self.session = session
@@ -43,31 +156,116 @@ class JobScraper:
         # Store initial search parameters
         self.search_params = {}
         self.max_browsers = max_browsers
-        self.scraped_pages = set()  # Track already scraped pages
-        self.job_ids_buffer = deque()
-        self.job_ids_lock = asyncio.Lock()
-        self.listing_pages_finished = False
+        self.detail_workers = 20
+        self.context_max_pages = 100  # detail pages rendered before a worker renews its context
+        self._known_ids = set()  # external_ids already stored in the database
+        self.insert_batch_size = 50
+        self.flush_interval = 1.0  # seconds a partial batch waits before being inserted
         self.playwright = None
-        self.browsers = []
+        self.browser = None
+        self.http = None
         self.browser_sem = asyncio.Semaphore(self.max_browsers)
+        # Idle (context, page, pages_done) used by detail workers for browser fallbacks,
+        # at most max_browsers of them exist across every search running on this scraper
+        self._fallback_pages = asyncio.Queue()
+        self._fallback_open = 0
+        # Detail requests in flight over HTTP, shared by every search running on this scraper
+        self.max_http_requests = 8
+        self.http_sem = asyncio.Semaphore(self.max_http_requests)
+        self.http_retries = 2  # retries of a throttled (429) or failing (5xx) detail request
+        self.http_retry_delay = 1.0  # seconds, doubled on each retry unless Retry-After says otherwise
         # Configure logging level
         if hasattr(logging, debug_level.upper()):
             logger.setLevel(getattr(logging, debug_level.upper()))
 
     async def __aenter__(self):
         """
-        Starts the Playwright context.
+        Starts the Playwright context, the shared browser and the HTTP client, and loads
+        the job IDs already stored in the database.
         """
+        self._known_ids = await self.job_offer_manager.get_external_ids()
+        self.http = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": _HTTP_USER_AGENT, "Accept-Language": self.language},
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=50),
+            timeout=15.0,
+            follow_redirects=True
+        )
         self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=True, args=_BROWSER_ARGS)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """
-        Stops the Playwright context.
+        Closes the HTTP client, the shared browser and stops the Playwright context.
         """
+        while not self._fallback_pages.empty():
+            context, _, _ = self._fallback_pages.get_nowait()
+            await context.close()
+        self._fallback_open = 0
+        await self.http.aclose()
+        self.http = None
+        await self.browser.close()
+        self.browser = None
         await self.playwright.stop()
         self.playwright = None
 
+    async def _new_context(self):
+        """
+        Opens a context on the shared browser with static resources blocked.
+        """
+        context = await self.browser.new_context()
+        await context.route("**/*", _block_static_resources)
+        return context
+
+    @asynccontextmanager
+    async def _acquire_context(self):
+        """
+        Yields a fresh context on the shared browser, with static resources blocked.
+        At most max_browsers contexts are open at the same time.
+        """
+        async with self.browser_sem:
+            context = await self._new_context()
+            try:
+                yield context
+            finally:
+                await context.close()
+
+    async def _take_fallback_page(self):
+        """
+        Takes an idle fallback page, opening one while fewer than max_browsers exist,
+        otherwise waits for another worker to release one.
+
+        Returns:
+            tuple: (context, page, pages_done) to hand back to _release_fallback_page.
+        """
+        if self._fallback_pages.empty() and self._fallback_open < self.max_browsers:
+            self._fallback_open += 1
+            try:
+                context = await self._new_context()
+                return context, await context.new_page(), 0
+            except Exception:
+                self._fallback_open -= 1
+                raise
+        return await self._fallback_pages.get()
+
+    async def _release_fallback_page(self, context, page, pages_done: int, discard: bool = False):
+        """
+        Returns a fallback page to the pool, or closes its context once it rendered
+        context_max_pages pages or failed.
+
+        Args:
+            context: Context of the page.
+            page: The Playwright page.
+            pages_done (int): Pages rendered by this context so far.
+            discard (bool): Close the context regardless of its use count.
+        """
+        if discard or pages_done >= self.context_max_pages:
+            self._fallback_open -= 1
+            await context.close()
+        else:
+            self._fallback_pages.put_nowait((context, page, pages_done))
+
     def build_url(self, page: Optional[int] = None, jobid: Optional[str] = None, term: Optional[str] = None,
                   employment_grade_min: Optional[int] = None, employment_grade_max: Optional[int] = None,
                   publication_date: Optional[int] = None, category: Optional[List[int]] = None,
@@ -78,67 +276,139 @@ class JobScraper:
         Returns:
             str: The constructed URL.
         """
-        params = []
-        if page:
-            params.append(f"page={page}")
-        if jobid:
-            params.append(f"jobid={jobid}")
-        if term:
-            params.append(f"term={term}")
-        if employment_grade_min is not None:
-            params.append(f"employment-grade-min={employment_grade_min}")
-        if employment_grade_max is not None:
-            params.append(f"employment-grade-max={employment_grade_max}")
-        if publication_date:
-            params.append(f"publication-date={publication_date}")
-        if category:
-            params.extend([f"category={cat}" for cat in category])
-        if benefit:
-            params.append(f"benefit={benefit}")
-        if region:
-            params.extend([f"region={reg}" for reg in region])
-
-        if params:
-            return f"{self.base_url}?{'&'.join(params)}"
-        return self.base_url
-
-    async def scrape_page(self, page_number: int):
+        return _build_url(self.base_url, page, jobid, term, employment_grade_min, employment_grade_max,
+                          publication_date, tuple(category) if category is not None else None,
+                          benefit, tuple(region) if region is not None else None)
+
+    async def scrape_page(self, run: ScrapeRun, page_number: int):
         """
         Scrapes job IDs from a given page number.
 
         Args:
+            run (ScrapeRun): The search the page belongs to.
             page_number (int): The page number to scrape.
         """
-        async with self.browser_sem:
-            browser = await self.playwright.chromium.launch(headless=True)
-            page = await browser.new_page()
-            search_params = {**self.search_params, 'page': page_number}
-            url = self.build_url(**{k: v for k, v in search_params.items() if v is not None})
-            logger.info("Navigating to page %d...", page_number)
+        url = f"{run.base_query}{run.page_sep}page={page_number}"
+        logger.info("Fetching page %d...", page_number)
+        try:
+            response = await self._http_get(url)
+            if response is None or response.status_code == 403:
+                job_ids = []
+            else:
+                response.raise_for_status()
+                job_ids = list(dict.fromkeys(_SERP_RE.findall(response.text)))
+            if not job_ids:
+                logger.debug("No job IDs over HTTP for page %d, falling back to browser", page_number)
+                job_ids = await self.scrape_page_with_browser(url)
+            logger.info("Job IDs found on page %d: %d", page_number, len(job_ids))
+            logger.debug("Job IDs of page %d: %s", page_number, job_ids)
+            await self.add_job_ids_to_buffer(run, job_ids)
+        except Exception as e:
+            logger.error("Error processing page %d: %s", page_number, str(e))
+
+    async def probe_first_page(self, run: ScrapeRun):
+        """
+        Loads the first search page to find the number of pages and its job IDs.
+        The page is fetched over HTTP, and rendered in the browser only if its HTML
+        lists no job.
 
-            try:
-                await page.goto(url)
-                await page.wait_for_load_state("load")
-                await page.wait_for_selector("div[data-cy='vacancy-serp-item']", state="attached", timeout=15000)
+        Args:
+            run (ScrapeRun): The search to probe.
 
-                job_elements = await page.query_selector_all("[data-cy^='serp-item-']")
-                job_ids = []
-                for elem in job_elements:
-                    data_cy = await elem.get_attribute("data-cy")
-                    if data_cy and data_cy.startswith("serp-item-"):
-                        candidate = data_cy[len("serp-item-"):]
-                        if self.is_valid_job_id(candidate):
-                            job_ids.append(candidate)
-                        else:
-                            logger.debug("Ignored invalid job id candidate: %s", candidate)
-                logger.info("Job IDs found on page %d: %s", page_number, job_ids)
-                await self.add_job_ids_to_buffer(job_ids)
+        Returns:
+            tuple: The number of pages and the job IDs of the first page.
+        """
+        logger.info("Navigating to target URL...")
+        try:
+            response = await self._http_get(run.base_query)
+            if response is None:
+                raise RuntimeError("retries exhausted")
+            response.raise_for_status()
+            first_page_ids = list(dict.fromkeys(_SERP_RE.findall(response.text)))
+            if first_page_ids:
+                tree = HTMLParser(response.text)
+                texts = [node.text(separator="\n") for node in tree.css(_PAGINATION_SELECTOR)]
+                return self._max_page(texts), first_page_ids
+            logger.debug("No job IDs in HTML of the first page, falling back to browser")
+        except Exception as e:
+            logger.error("Error fetching the first page: %s", str(e))
+
+        async with self._acquire_context() as context:
+            page = await context.new_page()
+            await page.goto(run.base_query)
+            await page.wait_for_load_state("load")
+            texts = await page.locator(_PAGINATION_SELECTOR).all_inner_texts()
+            return self._max_page(texts), await self._read_job_ids(page)
+
+    def _max_page(self, texts: List[str]) -> int:
+        """
+        Finds the last page number in the texts of the pagination elements.
 
-            except Exception as e:
-                logger.error("Error processing page %d: %s", page_number, str(e))
-            finally:
-                await page.close()
-                await browser.close()
+        Args:
+            texts (List[str]): Texts of the pagination elements.
+
+        Returns:
+            int: The number of pages, 1 if there is no pagination.
+        """
+        if not texts:
+            logger.info("No pagination found, only one page available")
+            return 1
+        page_numbers = [int(num) for text_content in texts for num in _PAGENUM_RE.findall(text_content)]
+        max_page = max(page_numbers) if page_numbers else 1
+        logger.info(f"Total number of pages found: {max_page}")
+        return max_page
+
+    async def page_worker(self, run: ScrapeRun, page_q: asyncio.Queue):
+        """
+        Scrapes the page numbers read from the queue until a None sentinel.
+
+        Args:
+            run (ScrapeRun): The search the pages belong to.
+            page_q (asyncio.Queue): Queue of page numbers to scrape.
+        """
+        while True:
+            page_number = await page_q.get()
+            if page_number is None:
+                break
+            await self.scrape_page(run, page_number)
+
+    async def scrape_page_with_browser(self, url: str) -> List[str]:
+        """
+        Renders a search page in the shared browser and reads its job IDs.
+
+        Args:
+            url (str): URL of the search page.
+
+        Returns:
+            List[str]: The job IDs listed on the page.
+        """
+        async with self._acquire_context() as context:
+            page = await context.new_page()
+            await page.goto(url)
+            await page.wait_for_load_state("domcontentloaded")
+            await page.wait_for_selector("div[data-cy='vacancy-serp-item']", state="attached", timeout=15000)
+            return await self._read_job_ids(page)
+
+    async def _read_job_ids(self, page) -> List[str]:
+        """
+        Reads the job IDs of the listing items rendered on a search page.
+
+        Args:
+            page: Playwright page showing a search page.
+
+        Returns:
+            List[str]: The valid job IDs found on the page.
+        """
+        candidates = await page.locator("[data-cy^='serp-item-']").evaluate_all(
+            "els => els.map(e => e.getAttribute('data-cy').slice('serp-item-'.length))"
+        )
+        job_ids = []
+        for candidate in candidates:
+            if self.is_valid_job_id(candidate):
+                job_ids.append(candidate)
+            else:
+                logger.debug("Ignored invalid job id candidate: %s", candidate)
+        return job_ids
 
     async def start_scraping(self, term: Optional[str] = None, employment_grade_min: Optional[int] = None,
                           employment_grade_max: Optional[int] = None, publication_date: Optional[int] = None,
@@ -158,70 +428,85 @@ class JobScraper:
             'region': region
         }
 
-        # Scan total number of available pages
-        browser = await self.playwright.chromium.launch(headless=True)
-        page = await browser.new_page()
-        logger.info("Navigating to target URL...")
-        initial_url = self.build_url(**{k: v for k, v in self.search_params.items() if v is not None})
-        await page.goto(initial_url)
-        await page.wait_for_load_state("load")
-
-        try:
-            selector = 'div.d_flex.ai_center.gap_s4'
+        # Only the page number changes between listing pages
+        base_query = self.build_url(**{k: v for k, v in self.search_params.items() if v is not None})
+        run = ScrapeRun(base_query=base_query, page_sep='&' if '?' in base_query else '?')
 
-            # Check if element exists
-            element = await page.query_selector(selector)
-            if not element:
-                logger.info("No pagination found, only one page available")
-                max_page = 1
-            else:
-                page_numbers = []
-                elements = await page.query_selector_all(selector)
-
-                for element in elements:
-                    text_content = await element.inner_text()
-                    numbers = [int(num) for num in re.findall(r'\d+', text_content)]
-                    page_numbers.extend(numbers)
-
-                max_page = max(page_numbers) if page_numbers else 1
-                logger.info(f"Total number of pages found: {max_page}")
+        # Scan total number of available pages
+        max_page, first_page_ids = await self.probe_first_page(run)
 
-        finally:
-            await page.close()
-            await browser.close()
+        db_writer = asyncio.create_task(self._db_writer(run))
 
         # Start detail workers before scraping pages
-        detail_workers = [asyncio.create_task(self.job_detail_worker()) for _ in range(5)]
-
-        # Scrape pages concurrently
-        tasks = []
-        for current_page in range(1, max_page + 1):
-            if current_page not in self.scraped_pages:
-                self.scraped_pages.add(current_page)
-                tasks.append(self.scrape_page(current_page))
+        detail_workers = [asyncio.create_task(self.job_detail_worker(run)) for _ in range(self.detail_workers)]
 
-        await asyncio.gather(*tasks)
-        self.listing_pages_finished = True
+        try:
+            if first_page_ids:
+                logger.info("Job IDs found on page 1: %d", len(first_page_ids))
+                logger.debug("Job IDs of page 1: %s", first_page_ids)
+                await self.add_job_ids_to_buffer(run, first_page_ids)
+                first_page = 2
+            else:
+                first_page = 1
+
+            # Scrape pages with a fixed pool of page workers
+            page_q = asyncio.Queue()
+            for current_page in range(first_page, max_page + 1):
+                page_q.put_nowait(current_page)
+            page_workers = min(self.max_browsers, max_page - first_page + 1)
+            for _ in range(page_workers):
+                page_q.put_nowait(None)
+            await asyncio.gather(*[self.page_worker(run, page_q) for _ in range(page_workers)])
+
+            # One sentinel per worker signals that no more job IDs will come
+            for _ in detail_workers:
+                await run.job_ids_queue.put(None)
+
+            # Wait for detail workers to finish
+            await asyncio.gather(*detail_workers)
+        finally:
+            # On cancellation or error the workers would wait on job_ids_queue forever
+            for worker in detail_workers:
+                worker.cancel()
+            await asyncio.gather(*detail_workers, return_exceptions=True)
 
-        # Wait for detail workers to finish
-        await asyncio.gather(*detail_workers)
+            # Let the writer insert the remaining offers, including those buffered before a cancellation
+            await run.db_q.put(None)
+            await db_writer
 
-    async def get_element_text(self, page, selector):
+    def build_job_offer_data(self, job_id: str, detail_url: str, fields: dict) -> dict:
         """
-        Retrieves the inner text of an element specified by a selector.
+        Builds the job offer record from the fields read on a detail page.
 
         Args:
-            page: The page object.
-            selector (str): The CSS selector for the element.
+            job_id (str): The job ID.
+            detail_url (str): URL of the detail page.
+            fields (dict): Raw field values keyed by job offer column.
 
         Returns:
-            str: The inner text of the element, or None if not found.
+            dict: Job offer data ready to be inserted.
         """
-        try:
-            element = await page.query_selector(selector)
-            return await element.inner_text() if element else None
-        except Exception:
-            return None
+        work_location = fields.get("work_location")
+        if work_location:
+            if "Location" in work_location or "Place" in work_location:
+                work_location = work_location.split(":")[-1].strip()
+        categories = fields.get("categories")
+        return {
+            "external_id": job_id,
+            "company_name": fields.get("company_name"),
+            "job_title": fields.get("job_title"),
+            "job_description": fields.get("job_description"),
+            "job_link": detail_url,
+            "posted_date": fields.get("posted_date"),
+            "work_location": work_location,
+            "contract_type": fields.get("contract_type"),
+            "activity_rate": fields.get("activity_rate"),
+            "company_info": fields.get("company_info"),
+            "company_contact": fields.get("company_contact"),
+            "company_url": fields.get("company_url") or "Not specified",
+            "categories": ", ".join(categories) if categories else None,
+            "quick_apply": bool(fields.get("quick_apply"))
+        }
 
     def is_valid_job_id(self, candidate: str) -> bool:
         """
@@ -233,108 +518,174 @@ class JobScraper:
         Returns:
             bool: True if valid, False otherwise.
         """
-        try:
-            uuid.UUID(candidate)
-            return True
-        except ValueError:
-            return False
+        return bool(_UUID_RE.match(candidate))
 
-    async def add_job_ids_to_buffer(self, job_ids: list):
+    async def add_job_ids_to_buffer(self, run: ScrapeRun, job_ids: list):
         """
-        Adds job IDs to the buffer.
+        Adds job IDs to the queue consumed by the detail workers, skipping IDs already
+        queued during this search or already stored in the database.
 
         Args:
+            run (ScrapeRun): The search the job IDs were found by.
             job_ids (list): List of job IDs to add.
         """
-        async with self.job_ids_lock:
-            self.job_ids_buffer.extend(job_ids)
+        new_ids = [job_id for job_id in dict.fromkeys(job_ids)
+                   if job_id not in run.enqueued_ids and job_id not in self._known_ids]
+        run.enqueued_ids.update(new_ids)
+        for job_id in new_ids:
+            await run.job_ids_queue.put(job_id)
+
+    async def _db_writer(self, run: ScrapeRun):
+        """
+        Inserts the job offers read from the db_q of the search in batches of
+        insert_batch_size, or whatever arrived within flush_interval seconds,
+        until a None sentinel.
 
-    async def job_detail_worker(self):
+        Args:
+            run (ScrapeRun): The search whose offers are inserted.
         """
-        Processes job detail pages using job IDs from the buffer.
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            job_offer_data = await run.db_q.get()
+            if job_offer_data is None:
+                break
+            rows = [job_offer_data]
+            deadline = loop.time() + self.flush_interval
+            while len(rows) < self.insert_batch_size:
+                try:
+                    job_offer_data = await asyncio.wait_for(run.db_q.get(), timeout=deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if job_offer_data is None:
+                    done = True
+                    break
+                rows.append(job_offer_data)
+            await self.insert_job_offers(rows)
+
+    async def insert_job_offers(self, rows: List[dict]):
+        """
+        Inserts a batch of job offers in a single transaction.
+
+        Args:
+            rows (List[dict]): Job offer fields of each offer.
+        """
+        try:
+            inserted = await self.job_offer_manager.add_job_offers_bulk(rows)
+            # Rows rejected for missing fields stay unknown so a later search retries them
+            self._known_ids.update(
+                row["external_id"] for row in rows if self.job_offer_manager.has_required_fields(row)
+            )
+            logger.info("Job offers added from detail pages: %d/%d", inserted, len(rows))
+        except Exception as e:
+            logger.error("Error inserting %d job offers: %s", len(rows), str(e))
+
+    async def _http_get(self, url: str) -> Optional[httpx.Response]:
+        """
+        GETs a page under the HTTP limiter, retrying throttled (429), failing (5xx) or
+        unreachable requests with exponential backoff, honouring a numeric Retry-After.
+
+        Args:
+            url (str): URL to fetch.
+
+        Returns:
+            Optional[httpx.Response]: The response, or None once the retries are exhausted
+            and the caller should fall back to the browser.
+        """
+        for attempt in range(self.http_retries + 1):
+            try:
+                async with self.http_sem:
+                    response = await self.http.get(url)
+            except httpx.TransportError as e:
+                status, retry_after = None, None
+                logger.debug("HTTP fetch of %s failed: %s", url, e)
+            else:
+                status, retry_after = response.status_code, response.headers.get("Retry-After")
+                if status != 429 and status < 500:
+                    return response
+            if attempt == self.http_retries:
+                logger.debug("HTTP fetch of %s still failing (%s), falling back to browser", url, status)
+                return None
+            delay = self.http_retry_delay * 2 ** attempt
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            await asyncio.sleep(delay)
+
+    async def fetch_detail(self, detail_url: str) -> Optional[dict]:
+        """
+        Fetches a detail page over HTTP and parses it without a browser.
+
+        Args:
+            detail_url (str): URL of the detail page.
+
+        Returns:
+            Optional[dict]: The parsed fields, or None if the page has to be rendered
+            by the browser (request blocked, throttled or failing, or description missing).
+        """
+        response = await self._http_get(detail_url)
+        if response is None:
+            return None
+        if response.status_code == 403:
+            logger.debug("HTTP fetch blocked for %s, falling back to browser", detail_url)
+            return None
+        response.raise_for_status()
+        fields = _parse_detail_html(response.text)
+        if not fields["job_description"]:
+            logger.debug("No description in HTML of %s, falling back to browser", detail_url)
+            return None
+        return fields
+
+    async def fetch_detail_with_browser(self, page, detail_url: str) -> dict:
+        """
+        Renders a detail page in the shared browser and reads its fields.
+
+        Args:
+            page: Playwright page reused by the calling worker.
+            detail_url (str): URL of the detail page.
+
+        Returns:
+            dict: Raw field values keyed by job offer column.
+        """
+        async with self.browser_sem:
+            await page.goto(detail_url)
+            await page.wait_for_load_state("domcontentloaded")
+            # The fallback runs when the description is rendered client-side, wait for it
+            try:
+                await page.wait_for_selector("[data-cy='vacancy-description']", state="attached", timeout=15000)
+            except PlaywrightTimeout:
+                logger.debug("No description rendered on %s, parsing the page as is", detail_url)
+            return _parse_detail_html(await page.content())
+
+    async def job_detail_worker(self, run: ScrapeRun):
+        """
+        Processes job detail pages using job IDs from the queue until a None sentinel.
+        Browser fallbacks borrow a page from the scraper's pool, which reuses pages across
+        jobs and replaces their context every context_max_pages pages.
+
+        Args:
+            run (ScrapeRun): The search whose job IDs are processed.
         """
         while True:
-            async with self.job_ids_lock:
-                if not self.job_ids_buffer:
-                    if self.listing_pages_finished:
-                        break
-                    else:
-                        await asyncio.sleep(0.1)
-                        continue
-                job_id = self.job_ids_buffer.popleft()
-            if await self.job_offer_manager.external_id_exists(job_id):
+            job_id = await run.job_ids_queue.get()
+            if job_id is None:
+                break
+            if job_id in self._known_ids:
                 logger.info("Job offer already exists for job_id: %s", job_id)
                 continue
-            async with self.browser_sem:
-                browser = await self.playwright.chromium.launch(headless=True)
-                page = await browser.new_page()
-                detail_url = f"{self.base_url}detail/{job_id}/"
-                logger.info("Scraping detail page: %s", detail_url)
-                try:
-                    await page.goto(detail_url)
-                    await page.wait_for_load_state("load")
-                    job_description = await self.get_element_text(page, "[data-cy='vacancy-description']")
-                    if not job_description:
-                        try:
-                            main_content = await page.query_selector("main") or await page.query_selector("article") or await page.query_selector(".content")
-                            if main_content:
-                                job_description = await main_content.inner_text()
-                        except Exception:
-                            pass
-                    job_title = await self.get_element_text(page, "[data-cy='vacancy-title']")
-                    company_name = await self.get_element_text(page, "[data-cy='vacancy-logo']") or await self.get_element_text(page, ".grid-area_company")
-                    publication_date = await self.get_element_text(page, "[data-cy='info-publication']")
-                    activity_rate = await self.get_element_text(page, "[data-cy='info-workload']")
-                    contract_type = await self.get_element_text(page, "[data-cy='info-contract']")
-                    work_location = await self.get_element_text(page, "[data-cy='info-location-link']") or await self.get_element_text(page, "li:has(svg path[d^='M12 12c']) .fw_semibold + span")
-                    if work_location:
-                        if "Location" in work_location or "Place" in work_location:
-                            work_location = work_location.split(":")[-1].strip()
-                    company_info = await self.get_element_text(page, "[data-cy='vacancy-lead'] p")
-                    company_contact = await self.get_element_text(page, "[data-cy='vacancy-contact']")
-                    company_url = "Not specified"
-                    try:
-                        url_element = await page.query_selector("[data-cy='company-url']")
-                        if url_element:
-                            company_url = await url_element.get_attribute("href") or "Not specified"
-                    except Exception:
-                        pass
-                    categories = []
-                    try:
-                        category_elements = await page.query_selector_all("[data-cy='vacancy-meta'] a")
-                        for el in category_elements:
-                            text = await el.inner_text()
-                            if text.strip():
-                                categories.append(text)
-                    except Exception:
-                        pass
-                    quick_apply = False
+            detail_url = f"{self.base_url}detail/{job_id}/"
+            logger.info("Scraping detail page: %s", detail_url)
+            try:
+                fields = await self.fetch_detail(detail_url)
+                if fields is None:
+                    context, page, pages_done = await self._take_fallback_page()
                     try:
-                        quick_apply_element = await page.query_selector("[data-cy='dynamic-application-button']")
-                        quick_apply = bool(quick_apply_element)
-                    except Exception:
-                        pass
-                    job_offer_data = {
-                        "external_id": job_id,
-                        "company_name": company_name,
-                        "job_title": job_title,
-                        "job_description": job_description,
-                        "job_link": detail_url,
-                        "posted_date": publication_date,
-                        "work_location": work_location,
-                        "contract_type": contract_type,
-                        "activity_rate": activity_rate,
-                        "company_info": company_info,
-                        "company_contact": company_contact,
-                        "company_url": company_url,
-                        "categories": ", ".join(categories) if categories else None,
-                        "quick_apply": quick_apply
-                    }
-                    if await self.job_offer_manager.add_job_offer(**job_offer_data):
-                        logger.info(f"Job offer added from detail page: {job_id}")
-                except Exception as e:
-                    logger.error("Error scraping job detail for %s: %s", job_id, str(e))
-                finally:
-                    await page.close()
-                    await browser.close()
-        logger.info("Job detail worker finished processing.")
\ No newline at end of file
+                        fields = await self.fetch_detail_with_browser(page, detail_url)
+                    except BaseException:
+                        await self._release_fallback_page(context, page, pages_done, discard=True)
+                        raise
+                    await self._release_fallback_page(context, page, pages_done + 1)
+                job_offer_data = self.build_job_offer_data(job_id, detail_url, fields)
+                await run.db_q.put(job_offer_data)
+            except Exception as e:
+                logger.error("Error scraping job detail for %s: %s", job_id, str(e))
+        logger.info("Job detail worker finished processing.")
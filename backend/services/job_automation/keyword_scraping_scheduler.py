@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 from sqlmodel import Session
 
 from services.job_automation.jobup.scraper import JobScraper
@@ -10,7 +10,7 @@ from local.menus.scraping.config import ScrapingConfig
 logger = logging.getLogger(__name__)
 
 class KeywordScrapingScheduler:
-    def __init__(self, session: Session, user_id: int, keywords: List[str], interval_seconds: int = 3600, max_browsers: int = 5, scraping_config: ScrapingConfig = None):
+    def __init__(self, session: Session, user_id: int, keywords: List[str], interval_seconds: int = 3600, max_browsers: int = 5, scraping_config: ScrapingConfig = None, max_uses: int = 50):
         """
         Initialize the scheduler.
         :param session: Database session
@@ -19,6 +19,7 @@ class KeywordScrapingScheduler:
         :param interval_seconds: Interval between scraping rounds (default: 3600 seconds)
         :param max_browsers: Maximum number of browsers to use in scraping
         :param scraping_config: Optional ScrapingConfig to use for additional parameters
+        :param max_uses: Number of keywords scraped before the shared scraper is restarted
         """
         self.session = session
         self.user_id = user_id
@@ -26,45 +27,86 @@ class KeywordScrapingScheduler:
         self.interval_seconds = interval_seconds
         self.max_browsers = max_browsers
         self.running = False
+        # Set by stop() to wake the scheduler up from its sleep between intervals
+        self._stop_event = asyncio.Event()
         self.auto_apply = AutoApply(session, user_id)
         self.scraping_config = scraping_config or ScrapingConfig()
         self.current_keyword_index = 0
+        self.max_uses = max_uses
+        self._scraper: Optional[JobScraper] = None
+        self._scraper_uses = 0
+
+    async def __aenter__(self):
+        """
+        Start the scraper shared by all keywords.
+        """
+        await self._open_scraper()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Close the shared scraper.
+        """
+        await self._close_scraper()
+
+    async def _open_scraper(self):
+        # A re-entered context would otherwise leak the running browser and HTTP client
+        await self._close_scraper()
+        self._scraper = await JobScraper(self.session, max_browsers=self.max_browsers).__aenter__()
+        self._scraper_uses = 0
+
+    async def _close_scraper(self):
+        if self._scraper is not None:
+            scraper, self._scraper = self._scraper, None
+            await scraper.__aexit__(None, None, None)
 
     async def run(self):
         """
         Run the scheduler indefinitely. For each iteration:
-        1. Process one keyword per interval
-        2. After the keyword is processed, trigger auto-apply for new quick_apply offers
-        3. Move to the next keyword in the next interval
+        1. Process the next chunk of up to max_browsers keywords concurrently
+        2. After the chunk is processed, trigger auto-apply once for new quick_apply offers
+        3. Move to the next chunk in the next interval
         """
         self.running = True
-        while self.running:
-            try:
-                # Get the current keyword to process
-                if self.current_keyword_index >= len(self.keywords):
-                    self.current_keyword_index = 0
+        self._stop_event.clear()
+        async with self:
+            while self.running:
+                try:
+                    # Restart the scraper regularly so long sessions do not leak memory
+                    if self._scraper_uses >= self.max_uses:
+                        logger.info(f"Restarting scraper after {self._scraper_uses} keywords")
+                        await self._close_scraper()
+                        await self._open_scraper()
 
-                current_keyword = self.keywords[self.current_keyword_index]
-                logger.info(f"Processing keyword {self.current_keyword_index + 1}/{len(self.keywords)}: {current_keyword}")
+                    # Get the current chunk of keywords to process
+                    if self.current_keyword_index >= len(self.keywords):
+                        self.current_keyword_index = 0
 
-                # Process the current keyword
-                await self.start_scraping_for_keyword(current_keyword)
-                logger.info(f"Completed scraping for keyword: {current_keyword}")
+                    start = self.current_keyword_index
+                    chunk = self.keywords[start:start + self.max_browsers]
+                    logger.info(f"Processing keywords {start + 1}-{start + len(chunk)}/{len(self.keywords)}: {', '.join(chunk)}")
 
-                # Process any new quick_apply offers
-                if self.running:
-                    logger.info("Processing new quick-apply offers")
-                    await self.auto_apply.check_and_process_pending_jobs()
-                # Move to the next keyword for the next interval
-                self.current_keyword_index += 1
+                    # Process the keywords of the chunk concurrently, the chunk size bounds the concurrency
+                    await asyncio.gather(*[self.start_scraping_for_keyword(keyword) for keyword in chunk])
+                    logger.info(f"Completed scraping for keywords: {', '.join(chunk)}")
 
-            except Exception as e:
-                logger.error(f"Error in scheduler cycle: {e}")
+                    # Process any new quick_apply offers
+                    if self.running:
+                        logger.info("Processing new quick-apply offers")
+                        await self.auto_apply.check_and_process_pending_jobs()
+                    # Move to the next chunk for the next interval
+                    self.current_keyword_index += len(chunk)
 
-            # Sleep until next interval if still running
-            if self.running:
-                logger.info(f"Scheduler sleeping for {self.interval_seconds} seconds until next keyword")
-                await asyncio.sleep(self.interval_seconds)
+                except Exception as e:
+                    logger.error(f"Error in scheduler cycle: {e}")
+
+                # Sleep until next interval if still running
+                if self.running:
+                    logger.info(f"Scheduler sleeping for {self.interval_seconds} seconds until next keywords")
+                    try:
+                        await asyncio.wait_for(self._stop_event.wait(), self.interval_seconds)
+                    except asyncio.TimeoutError:
+                        pass
 
     async def start_scraping_for_keyword(self, keyword: str):
         """
@@ -73,17 +115,17 @@ class KeywordScrapingScheduler:
         """
         try:
             logger.info(f"Starting scraping for keyword: {keyword}")
-            async with JobScraper(self.session, max_browsers=self.max_browsers) as scraper:
-                # Start scraping with the keyword and additional configuration
-                await scraper.start_scraping(
-                    term=keyword,
-                    employment_grade_min=self.scraping_config.employment_grade_min,
-                    employment_grade_max=self.scraping_config.employment_grade_max,
-                    publication_date=self.scraping_config.publication_date,
-                    category=self.scraping_config.category,
-                    region=self.scraping_config.region
-                )
-                logger.info(f"Scraping completed for keyword: {keyword}")
+            self._scraper_uses += 1
+            # Start scraping with the keyword and additional configuration
+            await self._scraper.start_scraping(
+                term=keyword,
+                employment_grade_min=self.scraping_config.employment_grade_min,
+                employment_grade_max=self.scraping_config.employment_grade_max,
+                publication_date=self.scraping_config.publication_date,
+                category=self.scraping_config.category,
+                region=self.scraping_config.region
+            )
+            logger.info(f"Scraping completed for keyword: {keyword}")
         except Exception as e:
             logger.error(f"Error scraping for keyword '{keyword}': {e}")
 
@@ -92,4 +134,5 @@ class KeywordScrapingScheduler:
         Stop the scheduler loop gracefully.
         """
         logger.info("Stopping keyword scraping scheduler")
-        self.running = False
\ No newline at end of file
+        self.running = False
+        self._stop_event.set()
\ No newline at end of file